@@ -0,0 +1,91 @@
+import argparse
+import json
+import time
+
+from SnakeSim import (GRID_HEIGHT, GRID_WIDTH, MOVES, GridSearch, ReachabilityMap, SnakeGame, run_games,
+                      step_cell)
+
+def sample_states(games, grid_width, grid_height, every=10, seed=0, max_ticks=20_000):
+    # (blocked cells, head, food) as the bot saw them, taken from seeded games.
+    states = []
+    for game_seed in range(seed, seed + games):
+        game = SnakeGame(grid_width, grid_height, game_seed)
+        while game.alive and game.ticks < max_ticks:
+            if game.ticks % every == 0:
+                blocked = bytearray(game.grid.cells)
+                if len(game.snake) >= game.length and game.snake[0] != game.head:
+                    blocked[game.snake[0]] = 0
+                states.append((blocked, game.head, game.food))
+            game.step()
+    return states
+
+def flood_tick(search, blocked, head, food):
+    # The per-tick work before components: a fill from the head, A* for reachability and
+    # again for the path, and a fill per candidate move.
+    blocked[head] = 0
+    search.flood_fill(head, blocked)
+    search.a_star(head, food, blocked)
+    search.a_star(head, food, blocked)
+    for move in MOVES:
+        new_head = step_cell(head, move, search.width, search.height)
+        if new_head is not None and not blocked[new_head]:
+            blocked[new_head] = 1
+            search.flood_fill(new_head, blocked)
+            blocked[new_head] = 0
+    blocked[head] = 1
+
+def component_tick(search, reach, blocked, head, food):
+    reach.compute(blocked)
+    head_components = reach.adjacent_components(head)
+    for move in MOVES:
+        new_head = step_cell(head, move, reach.width, reach.height)
+        if new_head is not None and not blocked[new_head]:
+            reach.component_size(new_head)
+    if reach.component(food) in head_components:
+        search.a_star(head, food, blocked)
+
+def time_ticks(states, tick, *args):
+    start_time = time.perf_counter()
+    for blocked, head, food in states:
+        tick(*args, blocked, head, food)
+    return (time.perf_counter() - start_time) / len(states) * 1e6 if states else 0.0
+
+def run_benchmark(grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT, games=4, seed=0, end_to_end_games=0):
+    states = sample_states(games, grid_width, grid_height, seed=seed)
+    search = GridSearch(grid_width, grid_height)
+    reach = ReachabilityMap(grid_width, grid_height)
+    flood_us = time_ticks(states, flood_tick, search)
+    component_us = time_ticks(states, component_tick, search, reach)
+    report = {
+        "grid": [grid_width, grid_height],
+        "states": len(states),
+        "mean_snake_cells": sum(blocked.count(1) for blocked, _, _ in states) / len(states) if states else 0.0,
+        "flood_fill_tick_us": flood_us,
+        "components_tick_us": component_us,
+        "speedup": flood_us / component_us if component_us else 0.0,
+    }
+    if end_to_end_games:
+        report["end_to_end"] = run_games(end_to_end_games, seed, 0, grid_width, grid_height)
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-tick cost of the Snake bot's reachability analysis")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[GRID_WIDTH],
+                        help="Square grid sizes to benchmark")
+    parser.add_argument("--games", type=int, default=4, help="Seeded games to sample board states from")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--end-to-end", type=int, default=0, help="Also play this many full games per size")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    reports = [run_benchmark(size, size, args.games, args.seed, args.end_to_end) for size in args.sizes]
+    for report in reports:
+        print(f"{report['grid'][0]}x{report['grid'][1]}: {report['states']} states, "
+              f"flood fills {report['flood_fill_tick_us']:.0f} us/tick, "
+              f"components {report['components_tick_us']:.0f} us/tick ({report['speedup']:.1f}x)")
+        if "end_to_end" in report:
+            print(f"  end to end: {report['end_to_end']['ticks_per_s']:.0f} ticks/s, "
+                  f"mean score {report['end_to_end']['mean_score']:.0f}")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=2)
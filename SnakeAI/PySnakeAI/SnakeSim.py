@@ -0,0 +1,637 @@
+import argparse
+import heapq
+import json
+import random
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+GRID_WIDTH = 30
+GRID_HEIGHT = 30
+MOVES = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+SCORE_PER_FOOD = 10
+# A game that goes this many ticks per cell without eating is circling forever.
+STALL_TICKS_PER_CELL = 4
+# "astar" chases the food and falls back to survival heuristics; "cycle" follows a Hamiltonian
+# cycle and only takes A* shortcuts that cannot trap it.
+STRATEGIES = ("astar", "cycle")
+DEFAULT_STRATEGY = "astar"
+# Room a cycle shortcut leaves between the new head and the tail beyond the snake's own length.
+SHORTCUT_SLACK = 3
+
+# Cells are flat indices y * width + x throughout; neighbors come in the order of MOVES.
+@lru_cache(maxsize=None)
+def grid_neighbors(width, height):
+    neighbors = []
+    for cell in range(width * height):
+        x, y = cell % width, cell // width
+        neighbors.append(tuple(ny * width + nx for nx, ny in ((x+1, y), (x-1, y), (x, y+1), (x, y-1))
+                               if 0 <= nx < width and 0 <= ny < height))
+    return tuple(neighbors)
+
+# A Hamiltonian cycle through every cell: order[cell] is the cell's position on the cycle and
+# tour[position] the cell there. Row 0 runs right, the rows below zigzag over columns 1 and up,
+# and column 0 leads back to the start, so one side must be even.
+@lru_cache(maxsize=None)
+def hamiltonian_cycle(width, height):
+    if width < 2 or height < 2 or (width % 2 and height % 2):
+        raise ValueError(f"no Hamiltonian cycle on a {width}x{height} grid: one side must be even and at least 2")
+    transpose = height % 2 == 1
+    rows, cols = (width, height) if transpose else (height, width)
+    path = []
+    for row in range(rows):
+        across = range(1, cols) if row % 2 == 0 else range(cols - 1, 0, -1)
+        path.extend((col, row) for col in across)
+    path.extend((0, row) for row in range(rows - 1, -1, -1))
+    tour = array('l', (col * width + row if transpose else row * width + col for col, row in path))
+    order = array('l', [0]) * len(tour)
+    for position, cell in enumerate(tour):
+        order[cell] = position
+    return order, tour
+
+def heuristic(a, b, width):
+    return abs(a % width - b % width) + abs(a // width - b // width)
+
+# Snake body cells in a flat bytearray, updated as the head advances and the tail retracts.
+# entered[cell] is the serial number of the move that put a segment there, so that segment
+# leaves in entered[cell] - tail_serial + 1 ticks (later if the snake eats first).
+class OccupancyGrid:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.cells = bytearray(self.size)
+        self.entered = array('l', [0]) * self.size
+        self.head_serial = -1
+        self.tail_serial = 0
+
+    def push_head(self, cell):
+        self.head_serial += 1
+        self.cells[cell] = 1
+        self.entered[cell] = self.head_serial
+
+    def pop_tail(self, cell):
+        self.cells[cell] = 0
+        self.tail_serial += 1
+
+    def time_until_free(self, cell):
+        return self.entered[cell] - self.tail_serial + 1 if self.cells[cell] else 0
+
+# Reusable A* and flood-fill buffers for one grid size. A cell counts as seen in the current
+# search when its stamp matches, so nothing is cleared or allocated between searches.
+class GridSearch:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.neighbors = grid_neighbors(width, height)
+        size = width * height
+        self.seen = array('l', [0]) * size
+        self.open = array('l', [0]) * size
+        self.g_score = array('l', [0]) * size
+        self.came_from = array('l', [0]) * size
+        self.queue = array('l', [0]) * size
+        self.heap = []
+        self.stamp = 0
+
+    def flood_fill(self, start, blocked):
+        self.stamp += 1
+        stamp, seen, queue, neighbors = self.stamp, self.seen, self.queue, self.neighbors
+        seen[start] = stamp
+        queue[0] = start
+        head, tail = 0, 1
+        while head < tail:
+            node = queue[head]
+            head += 1
+            for neighbor in neighbors[node]:
+                if seen[neighbor] != stamp and not blocked[neighbor]:
+                    seen[neighbor] = stamp
+                    queue[tail] = neighbor
+                    tail += 1
+        return tail
+
+    def a_star(self, start, goal, blocked):
+        self.stamp += 1
+        stamp, seen, in_open, g_score, came_from = self.stamp, self.seen, self.open, self.g_score, self.came_from
+        neighbors, width = self.neighbors, self.width
+        goal_x, goal_y = goal % width, goal // width
+        open_list = self.heap
+        open_list.clear()
+        heapq.heappush(open_list, (0, start))
+        seen[start] = stamp
+        g_score[start] = 0
+        came_from[start] = -1
+        in_open[start] = stamp
+
+        while open_list:
+            _, current = heapq.heappop(open_list)
+            in_open[current] = 0
+
+            if current == goal:
+                return self.trace_path(current)
+
+            tentative_g = g_score[current] + 1
+            for neighbor in neighbors[current]:
+                if blocked[neighbor]:
+                    continue
+                if seen[neighbor] != stamp or tentative_g < g_score[neighbor]:
+                    seen[neighbor] = stamp
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    f = tentative_g + abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)
+
+                    if in_open[neighbor] != stamp:
+                        heapq.heappush(open_list, (f, neighbor))
+                        in_open[neighbor] = stamp
+        return None
+
+    # A* that only steps forward along a cycle (order[cell] is the cell's position on it) and
+    # never gets more than `limit` positions ahead of start.
+    def a_star_forward(self, start, goal, blocked, order, limit):
+        self.stamp += 1
+        stamp, seen, in_open, g_score, came_from = self.stamp, self.seen, self.open, self.g_score, self.came_from
+        neighbors, width, size = self.neighbors, self.width, len(order)
+        base = order[start]
+        goal_x, goal_y = goal % width, goal // width
+        open_list = self.heap
+        open_list.clear()
+        heapq.heappush(open_list, (0, start))
+        seen[start] = stamp
+        g_score[start] = 0
+        came_from[start] = -1
+        in_open[start] = stamp
+
+        while open_list:
+            _, current = heapq.heappop(open_list)
+            in_open[current] = 0
+
+            if current == goal:
+                return self.trace_path(current)
+
+            rank = (order[current] - base) % size
+            tentative_g = g_score[current] + 1
+            for neighbor in neighbors[current]:
+                if blocked[neighbor] or not rank < (order[neighbor] - base) % size <= limit:
+                    continue
+                if seen[neighbor] != stamp or tentative_g < g_score[neighbor]:
+                    seen[neighbor] = stamp
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
+                    f = tentative_g + abs(neighbor % width - goal_x) + abs(neighbor // width - goal_y)
+
+                    if in_open[neighbor] != stamp:
+                        heapq.heappush(open_list, (f, neighbor))
+                        in_open[neighbor] = stamp
+        return None
+
+    def trace_path(self, cell):
+        came_from = self.came_from
+        path = [cell]
+        while came_from[cell] != -1:
+            cell = came_from[cell]
+            path.append(cell)
+        path.reverse()
+        return path
+
+# Connected components of the free cells, labeled by one BFS sweep per tick. Every "how much
+# room" and "can I get there" question for the tick is then a lookup. Labels from earlier
+# ticks sit below `base`, so nothing is cleared between sweeps.
+class ReachabilityMap:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.neighbors = grid_neighbors(width, height)
+        self.labels = array('l', [-1]) * self.size
+        self.queue = array('l', [0]) * self.size
+        self.sizes = []
+        self.base = 0
+
+    def compute(self, blocked):
+        self.base += len(self.sizes)
+        base, labels, queue, neighbors, sizes = self.base, self.labels, self.queue, self.neighbors, self.sizes
+        sizes.clear()
+        for cell in range(self.size):
+            if blocked[cell] or labels[cell] >= base:
+                continue
+            label = base + len(sizes)
+            labels[cell] = label
+            queue[0] = cell
+            head, tail = 0, 1
+            while head < tail:
+                node = queue[head]
+                head += 1
+                for neighbor in neighbors[node]:
+                    if not blocked[neighbor] and labels[neighbor] < base:
+                        labels[neighbor] = label
+                        queue[tail] = neighbor
+                        tail += 1
+            sizes.append(tail)
+
+    def component(self, cell):
+        label = self.labels[cell]
+        return label - self.base if label >= self.base else -1
+
+    def component_size(self, cell):
+        component = self.component(cell)
+        return self.sizes[component] if component >= 0 else 0
+
+    def adjacent_components(self, cell):
+        components = set()
+        for neighbor in self.neighbors[cell]:
+            component = self.component(neighbor)
+            if component >= 0:
+                components.add(component)
+        return components
+
+# Keeps the A* path to the food across ticks instead of replanning on a timer. While the snake
+# follows it the plan stays valid: every cell ahead was free when it was planned and only the
+# head has moved onto the path since. After a detour the head may rejoin the path; then each
+# cell ahead is checked against when the body leaves it, and only the path beyond the first
+# cell that would still be occupied is searched again.
+class PathPlanner:
+    def __init__(self, search, grid):
+        self.search = search
+        self.grid = grid
+        self.path = None
+        self.index = 0
+        self.following = False
+        self.replans = 0
+        self.repairs = 0
+        self.reuses = 0
+
+    def detour(self):
+        self.following = False
+
+    def first_conflict(self, delay):
+        # delay: ticks before the tail starts moving again (the snake is still growing).
+        path, index, time_until_free = self.path, self.index, self.grid.time_until_free
+        for i in range(index + 1, len(path)):
+            if time_until_free(path[i]) + delay > i - index:
+                return i
+        return None
+
+    def replan(self, head, goal, blocked):
+        self.replans += 1
+        self.path = self.search.a_star(head, goal, blocked)
+        self.index = 0
+        return self.path is not None
+
+    def repair(self, conflict, goal, blocked):
+        # The head will have covered path[index:conflict] before the new suffix starts, so
+        # those cells stay blocked while it is searched.
+        path, index = self.path, self.index
+        start = path[conflict - 1]
+        for cell in path[index + 1:conflict - 1]:
+            blocked[cell] = 1
+        try:
+            suffix = self.search.a_star(start, goal, blocked)
+        finally:
+            for cell in path[index + 1:conflict - 1]:
+                blocked[cell] = 0
+        if suffix is None:
+            return False
+        self.repairs += 1
+        self.path = path[index:conflict - 1] + suffix
+        self.index = 0
+        return True
+
+    def next_cell(self, head, goal, blocked, delay=0):
+        path = self.path
+        if path is not None and path[-1] == goal and self.following and path[self.index] == head:
+            self.reuses += 1
+        elif path is not None and path[-1] == goal and head in path:
+            self.index = path.index(head)
+            conflict = self.first_conflict(delay)
+            if conflict is None:
+                self.reuses += 1
+            elif conflict == self.index + 1 or not self.repair(conflict, goal, blocked):
+                if not self.replan(head, goal, blocked):
+                    return None
+        elif not self.replan(head, goal, blocked):
+            return None
+        if self.index + 1 >= len(self.path):
+            return None
+        self.index += 1
+        self.following = True
+        return self.path[self.index]
+
+def step_cell(cell, move, width, height):
+    x, y = cell % width + move[0], cell // width + move[1]
+    if 0 <= x < width and 0 <= y < height:
+        return y * width + x
+    return None
+
+def evaluate_move(reach, blocked, head, move, food_pos, survival_mode):
+    new_head = step_cell(head, move, reach.width, reach.height)
+    if new_head is None or blocked[new_head]:
+        return -float('inf'), 0, 0, 0
+
+    # With the current head blocked, a fill from the new head covers exactly its component.
+    space = reach.component_size(new_head)
+    free_neighbors = 0
+    for neighbor in reach.neighbors[new_head]:
+        if not blocked[neighbor]:
+            free_neighbors += 1
+
+    food_dist = heuristic(new_head, food_pos, reach.width)
+
+    if survival_mode:
+        # Prioritize maximizing free space
+        score = space * 1000 + free_neighbors * 200
+    else:
+        # Prioritize minimizing distance to food
+        score = space * 1000 - food_dist
+
+    return score, space, free_neighbors, food_dist
+
+def find_safest_move(reach, blocked, head, food_pos, survival_mode, rng=random):
+    best_move = None
+    best_score = -float('inf')
+    max_space = 0
+    max_neighbors = 0
+    min_food_dist = float('inf')
+
+    moves = list(MOVES)
+    rng.shuffle(moves)
+
+    for move in moves:
+        score, space, neighbors, food_dist = evaluate_move(reach, blocked, head, move, food_pos, survival_mode)
+        if survival_mode:
+            if score > best_score or (score == best_score and neighbors > max_neighbors):
+                best_score = score
+                best_move = move
+                max_space = space
+                max_neighbors = neighbors
+        else:
+            if score > best_score or (score == best_score and food_dist < min_food_dist):
+                best_score = score
+                best_move = move
+                min_food_dist = food_dist
+
+    if survival_mode and max_space < reach.size // 10:
+        max_neighbors = 0
+        best_move = None
+        for move in moves:
+            _, space, neighbors, _ = evaluate_move(reach, blocked, head, move, food_pos, survival_mode)
+            if neighbors > max_neighbors or (neighbors == max_neighbors and space > max_space):
+                max_neighbors = neighbors
+                best_move = move
+                max_space = space
+
+    return best_move
+
+# Headless game state: the snake is a deque of cells from tail to head, mirrored in an
+# OccupancyGrid. step() lets the bot pick a move with its strategy (or takes one) and advances
+# one tick; rendering is left to observers such as Snake.py. Each "astar" decision labels the
+# free cells' components once and answers its space and reachability questions from them.
+class SnakeGame:
+    def __init__(self, grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT, seed=None, strategy=DEFAULT_STRATEGY):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}, expected one of {', '.join(STRATEGIES)}")
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.strategy = strategy
+        self.cycle = hamiltonian_cycle(grid_width, grid_height) if strategy == "cycle" else None
+        self.rng = random.Random(seed)
+        self.search = GridSearch(grid_width, grid_height)
+        self.reach = ReachabilityMap(grid_width, grid_height)
+        self.reset()
+
+    def reset(self):
+        self.grid = OccupancyGrid(self.grid_width, self.grid_height)
+        start = (self.grid_height // 2) * self.grid_width + self.grid_width // 2
+        self.snake = deque([start])
+        self.grid.push_head(start)
+        self.length = 1
+        self.score = 0
+        self.ticks = 0
+        self.ticks_since_food = 0
+        self.alive = True
+        self.won = False
+        self.stalled = False
+        self.survival_mode = False
+        self.planner = PathPlanner(self.search, self.grid)
+        self.shortcut = None
+        self.shortcut_index = 0
+        self.food = self.food_position()
+
+    @property
+    def head(self):
+        return self.snake[-1]
+
+    def xy(self, cell):
+        return cell % self.grid_width, cell // self.grid_width
+
+    def move_to(self, cell):
+        head = self.head
+        return cell % self.grid_width - head % self.grid_width, cell // self.grid_width - head // self.grid_width
+
+    def food_position(self):
+        size = self.grid.size
+        free = size - len(self.snake)
+        if free <= 0:
+            return None
+        cells = self.grid.cells
+        if free * 4 < size:
+            # Nearly full: rejection sampling would spin, so pick among the free cells.
+            return self.rng.choice([cell for cell in range(size) if not cells[cell]])
+        while True:
+            cell = self.rng.randrange(size)
+            if not cells[cell]:
+                return cell
+
+    def choose_move(self):
+        # Plan against the whole body minus the tail when it moves away this tick: clear
+        # that cell in the occupancy grid for the duration of the decision.
+        cells = self.grid.cells
+        tail = self.snake[0]
+        tail_moves = len(self.snake) >= self.length and tail != self.head
+        if tail_moves:
+            cells[tail] = 0
+        try:
+            if self.cycle is not None:
+                return self._cycle_move(cells)
+            return self._choose_move(cells, len(self.snake) - tail_moves, self.length - len(self.snake))
+        finally:
+            if tail_moves:
+                cells[tail] = 1
+
+    def _choose_move(self, blocked, num_blocked, growth):
+        reach = self.reach
+        grid_head = self.head
+        grid_food = self.food
+
+        reach.compute(blocked)
+        head_components = reach.adjacent_components(grid_head)
+        accessible_space = sum(reach.sizes[component] for component in head_components)
+        has_inaccessible_areas = accessible_space < self.grid.size - num_blocked
+        can_reach_food = reach.component(grid_food) in head_components
+
+        self.survival_mode = has_inaccessible_areas and not can_reach_food
+
+        if can_reach_food and not self.survival_mode:
+            next_node = self.planner.next_cell(grid_head, grid_food, blocked, max(growth, 0))
+            if next_node is not None:
+                return self.move_to(next_node)
+
+        self.planner.detour()
+        safest_move = find_safest_move(reach, blocked, grid_head, grid_food, self.survival_mode, self.rng)
+        if safest_move:
+            return safest_move
+
+        possible_moves = []
+        for move in MOVES:
+            new_head = step_cell(grid_head, move, self.grid_width, self.grid_height)
+            if new_head is not None and not blocked[new_head]:
+                possible_moves.append(move)
+        return self.rng.choice(possible_moves) if possible_moves else None
+
+    def _cycle_move(self, blocked):
+        # The body always lies on the cycle in order from tail to head, so the cells from the
+        # head onward to the tail are empty. The head may skip ahead along the cycle as long as
+        # it leaves the tail more than a snake length of room: a shortcut path stays within
+        # that window, so it remains safe to follow until the food is eaten.
+        order, tour = self.cycle
+        size = self.grid.size
+        head = self.head
+        head_order = order[head]
+        path = self.shortcut
+        if path is not None and path[-1] == self.food and path[self.shortcut_index] == head:
+            self.shortcut_index += 1
+            return self.move_to(path[self.shortcut_index])
+
+        self.shortcut = None
+        tail_gap = (order[self.snake[0]] - head_order) % size or size
+        max_jump = tail_gap - self.length - SHORTCUT_SLACK
+        food_gap = (order[self.food] - head_order) % size
+        if 1 < food_gap <= max_jump:
+            path = self.search.a_star_forward(head, self.food, blocked, order, max_jump)
+            if path is not None:
+                self.shortcut = path
+                self.shortcut_index = 1
+                return self.move_to(path[1])
+
+        # The food is out of reach for now: make the furthest safe jump that stops short of it.
+        next_cell = tour[(head_order + 1) % size]
+        best_jump = 1
+        for neighbor in self.search.neighbors[head]:
+            jump = (order[neighbor] - head_order) % size
+            if best_jump < jump <= max_jump and jump < food_gap and not blocked[neighbor]:
+                best_jump = jump
+                next_cell = neighbor
+        return self.move_to(next_cell)
+
+    def step(self, move=None):
+        if not self.alive:
+            return False
+        if move is None:
+            move = self.choose_move()
+        self.ticks += 1
+        self.ticks_since_food += 1
+        if move is None:
+            self.alive = False
+            return False
+
+        new_head = step_cell(self.head, move, self.grid_width, self.grid_height)
+        if new_head is None:
+            self.alive = False
+            return False
+
+        if len(self.snake) >= self.length:
+            self.grid.pop_tail(self.snake.popleft())
+        if self.grid.cells[new_head]:
+            self.alive = False
+            return False
+        self.snake.append(new_head)
+        self.grid.push_head(new_head)
+
+        if new_head == self.food:
+            self.length += 1
+            self.score += SCORE_PER_FOOD
+            self.ticks_since_food = 0
+            self.food = self.food_position()
+            if self.food is None:
+                self.won = True
+                self.alive = False
+                return False
+
+        if self.ticks_since_food > STALL_TICKS_PER_CELL * self.grid.size:
+            self.stalled = True
+            self.alive = False
+        return self.alive
+
+    def run(self, max_ticks=None):
+        while self.step():
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+        return self.result()
+
+    def result(self):
+        return {"score": self.score, "length": len(self.snake), "ticks": self.ticks, "won": self.won,
+                "stalled": self.stalled, "replans": self.planner.replans, "repairs": self.planner.repairs,
+                "reuses": self.planner.reuses}
+
+def play_games(seeds, grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT, max_ticks=None, strategy=DEFAULT_STRATEGY):
+    return [SnakeGame(grid_width, grid_height, seed, strategy).run(max_ticks) for seed in seeds]
+
+def run_games(games, seed=0, workers=0, grid_width=GRID_WIDTH, grid_height=GRID_HEIGHT, max_ticks=None,
+              chunk_size=8, strategy=DEFAULT_STRATEGY):
+    seeds = list(range(seed, seed + games))
+    chunks = [(seeds[i:i + chunk_size], grid_width, grid_height, max_ticks, strategy)
+              for i in range(0, len(seeds), chunk_size)]
+    start_time = time.perf_counter()
+    if workers > 0:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [result for chunk in executor.map(play_games, *zip(*chunks)) for result in chunk]
+    else:
+        results = play_games(seeds, grid_width, grid_height, max_ticks, strategy)
+    elapsed = time.perf_counter() - start_time
+
+    scores = [result["score"] for result in results]
+    ticks = sum(result["ticks"] for result in results)
+    food = sum(scores) // SCORE_PER_FOOD
+    return {
+        "games": len(results),
+        "grid": [grid_width, grid_height],
+        "strategy": strategy,
+        "seed": seed,
+        "mean_score": sum(scores) / len(scores) if scores else 0.0,
+        "max_score": max(scores, default=0),
+        "mean_ticks": ticks / len(results) if results else 0.0,
+        "completed": sum(result["won"] for result in results),
+        "stalled": sum(result["stalled"] for result in results),
+        "food_per_1000_ticks": food * 1000 / ticks if ticks else 0.0,
+        "replans": sum(result["replans"] for result in results),
+        "repairs": sum(result["repairs"] for result in results),
+        "reuses": sum(result["reuses"] for result in results),
+        "elapsed_s": elapsed,
+        "games_per_minute": len(results) * 60 / elapsed if elapsed > 0 else 0.0,
+        "ticks_per_s": ticks / elapsed if elapsed > 0 else 0.0,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play the Snake bot headless as fast as possible")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="Game i uses seed + i")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = play in this process)")
+    parser.add_argument("--width", type=int, default=GRID_WIDTH)
+    parser.add_argument("--height", type=int, default=GRID_HEIGHT)
+    parser.add_argument("--max-ticks", type=int, default=None, help="Stop each game after this many ticks")
+    parser.add_argument("--strategy", choices=STRATEGIES, default=DEFAULT_STRATEGY,
+                        help="A* with survival fallback, or a Hamiltonian cycle with safe shortcuts")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this path")
+    args = parser.parse_args()
+    if args.strategy == "cycle":
+        try:
+            hamiltonian_cycle(args.width, args.height)
+        except ValueError as e:
+            parser.error(str(e))
+
+    report = run_games(args.games, args.seed, args.workers, args.width, args.height, args.max_ticks,
+                       strategy=args.strategy)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
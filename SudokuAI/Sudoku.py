@@ -1,8 +1,8 @@
+import argparse
 import pygame
-import random
 import sys
 
-pygame.init()
+from SudokuCore import GRID_SIZE, EventWriter, SolverEvents, SudokuBoard
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -14,168 +14,26 @@ RED = (255, 0, 0)
 HIGHLIGHT = (240, 240, 150)
 
 WIDTH, HEIGHT = 540, 540
-GRID_SIZE = 9
 CELL_SIZE = WIDTH // GRID_SIZE
-
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("quikc maths")
-clock = pygame.time.Clock()
-
-number_font = pygame.font.SysFont('Arial', 35)
-
-class SudokuBoard:
-    def __init__(self):
-        self.board = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.original = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.selected_cell = None
-        self.generate_board()
-        self.save_original()
-    
-    def save_original(self):
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                self.original[i][j] = self.board[i][j]
-    
-    def is_original(self, row, col):
-        return self.original[row][col] != 0
-    
-    def is_valid_move(self, row, col, num):
-        for i in range(GRID_SIZE):
-            if self.board[row][i] == num:
-                return False
-        
-        for i in range(GRID_SIZE):
-            if self.board[i][col] == num:
-                return False
-        
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if self.board[i][j] == num:
-                    return False
-        
-        return True
-    
-    def solve_board(self, board):
-        empty = self.find_empty(board)
-        if not empty:
-            return True
-        
-        row, col = empty
-        
-        for num in range(1, 10):
-            if self.is_valid_for_solve(board, row, col, num):
-                board[row][col] = num
-                
-                if self.solve_board(board):
-                    return True
-                
-                board[row][col] = 0
-        
-        return False
-    
-    def is_valid_for_solve(self, board, row, col, num):
-        for i in range(GRID_SIZE):
-            if board[row][i] == num:
-                return False
-        
-        for i in range(GRID_SIZE):
-            if board[i][col] == num:
-                return False
-        
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for i in range(box_row, box_row + 3):
-            for j in range(box_col, box_col + 3):
-                if board[i][j] == num:
-                    return False
-        
-        return True
-    
-    def find_empty(self, board):
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                if board[i][j] == 0:
-                    return (i, j)
-        return None
-    
-    def generate_board(self):
-        empty_board = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-        self.solve_board(empty_board)
-        
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                self.board[i][j] = empty_board[i][j]
-        
-        positions = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
-        random.shuffle(positions)
-        
-        cells_to_remove = 45
-        
-        for row, col in positions[:cells_to_remove]:
-            self.board[row][col] = 0
-    
-    def find_best_empty_cell(self):
-        min_poss = 10
-        best_cell = None
-        for row in range(GRID_SIZE):
-            for col in range(GRID_SIZE):
-                if self.board[row][col] == 0:
-                    count = sum(1 for num in range(1, 10) if self.is_valid_move(row, col, num))
-                    if count < min_poss:
-                        min_poss = count
-                        best_cell = (row, col)
-        return best_cell
-    
-    def solve_ai(self):
-        stack = []
-        current_cell = self.find_best_empty_cell()
-        if not current_cell:
-            return
-        stack.append((current_cell, 0))
-        
-        while stack:
-            (row, col), num = stack.pop()
-            if num > 9:
-                self.board[row][col] = 0
-                yield (row, col, 0)
-                continue
-            if self.board[row][col] != 0:
-                continue
-            found = False
-            for n in range(num, 10):
-                if self.is_valid_move(row, col, n):
-                    self.board[row][col] = n
-                    yield (row, col, n)
-                    next_cell = self.find_best_empty_cell()
-                    if not next_cell:
-                        return
-                    stack.append(((row, col), n + 1))
-                    stack.append((next_cell, 0))
-                    found = True
-                    break
-            if not found:
-                self.board[row][col] = 0
-                yield (row, col, 0)
-    
-    def check_win(self):
-        for row in self.board:
-            if set(row) != set(range(1, 10)):
-                return False
-        for col in range(9):
-            if set(self.board[row][col] for row in range(9)) != set(range(1, 10)):
-                return False
-        for box_row in range(0, 9, 3):
-            for box_col in range(0, 9, 3):
-                box = [self.board[r][c] for r in range(box_row, box_row+3) for c in range(box_col, box_col+3)]
-                if set(box) != set(range(1, 10)):
-                    return False
-        return True
+# Cell interiors stop short of the thickest grid line, so redrawing one never touches the lines.
+CELL_INSET = 2
 
 class Game:
-    def __init__(self):
+    def __init__(self, steps_per_frame=1, frame_budget_ms=None, fps=60, events=None):
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("quikc maths")
+        self.clock = pygame.time.Clock()
+        self.number_font = pygame.font.SysFont('Arial', 35)
+        self.steps_per_frame = steps_per_frame
+        self.frame_budget_ms = frame_budget_ms
+        self.fps = fps
         self.board = SudokuBoard()
         self.game_over = False
-        self.solver = self.board.solve_ai()
+        self.solver = self.board.solve_ai(events)
+        self.glyphs = {}
+        self.dirty_cells = set()
+        self.full_redraw = True
     
     def handle_events(self):
         for event in pygame.event.get():
@@ -183,48 +41,106 @@ class Game:
                 pygame.quit()
                 sys.exit()
     
-    def draw(self):
-        screen.fill(WHITE)
+    def glyph(self, num, color):
+        key = (num, color)
+        surface = self.glyphs.get(key)
+        if surface is None:
+            surface = self.glyphs[key] = self.number_font.render(str(num), True, color)
+        return surface
+    
+    def cell_rect(self, row, col):
+        return pygame.Rect(col * CELL_SIZE + CELL_INSET, row * CELL_SIZE + CELL_INSET,
+                           CELL_SIZE - 2 * CELL_INSET + 1, CELL_SIZE - 2 * CELL_INSET + 1)
+    
+    def draw_cell(self, row, col):
+        rect = self.cell_rect(row, col)
+        self.screen.fill(WHITE, rect)
+        num = self.board.board[row][col]
+        if num != 0:
+            color = DARK_BLUE if self.board.is_original(row, col) else GREEN
+            number = self.glyph(num, color)
+            self.screen.blit(number, number.get_rect(center=rect.center))
+        return rect
+    
+    def draw_grid(self):
+        self.screen.fill(WHITE)
         for i in range(GRID_SIZE + 1):
             line_width = 3 if i % 3 == 0 else 1
-            pygame.draw.line(screen, BLACK, (0, i * CELL_SIZE), (WIDTH, i * CELL_SIZE), line_width)
-            pygame.draw.line(screen, BLACK, (i * CELL_SIZE, 0), (i * CELL_SIZE, HEIGHT), line_width)
-        
+            pygame.draw.line(self.screen, BLACK, (0, i * CELL_SIZE), (WIDTH, i * CELL_SIZE), line_width)
+            pygame.draw.line(self.screen, BLACK, (i * CELL_SIZE, 0), (i * CELL_SIZE, HEIGHT), line_width)
         for i in range(GRID_SIZE):
             for j in range(GRID_SIZE):
-                if self.board.board[i][j] != 0:
-                    color = DARK_BLUE if self.board.is_original(i, j) else GREEN
-                    number = number_font.render(str(self.board.board[i][j]), True, color)
-                    number_rect = number.get_rect(center=(j * CELL_SIZE + CELL_SIZE//2, i * CELL_SIZE + CELL_SIZE//2))
-                    screen.blit(number, number_rect)
-        
-        if self.game_over:
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 150))
-            screen.blit(overlay, (0, 0))
-            font = pygame.font.SysFont('Arial', 40, bold=True)
-            text = font.render("Solved!", True, DARK_BLUE)
-            text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
-            screen.blit(text, text_rect)
-        
-        pygame.display.flip()
+                self.draw_cell(i, j)
+    
+    def draw_solved(self):
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill((255, 255, 255, 150))
+        self.screen.blit(overlay, (0, 0))
+        font = pygame.font.SysFont('Arial', 40, bold=True)
+        text = font.render("Solved!", True, DARK_BLUE)
+        text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
+        self.screen.blit(text, text_rect)
+    
+    def draw(self):
+        if self.full_redraw:
+            self.draw_grid()
+            if self.game_over:
+                self.draw_solved()
+            pygame.display.flip()
+            self.full_redraw = False
+        elif self.dirty_cells:
+            pygame.display.update([self.draw_cell(row, col) for row, col in self.dirty_cells])
+        self.dirty_cells.clear()
+    
+    def advance_solver(self):
+        deadline = None
+        if self.frame_budget_ms is not None:
+            deadline = pygame.time.get_ticks() + self.frame_budget_ms
+        steps = 0
+        while self.steps_per_frame is None or steps < self.steps_per_frame:
+            try:
+                row, col, _ = next(self.solver)
+            except StopIteration:
+                self.finish()
+                return
+            self.dirty_cells.add((row, col))
+            steps += 1
+            if self.board.is_full():
+                self.finish()
+                return
+            if deadline is not None and pygame.time.get_ticks() >= deadline:
+                return
+    
+    def finish(self):
+        # The last placement leaves the solver suspended; resume it so it returns (and reports) its result.
+        for _ in self.solver:
+            pass
+        self.game_over = True
+        self.full_redraw = True
     
     def run(self):
-        last_step_time = pygame.time.get_ticks()
         while True:
             self.handle_events()
-            current_time = pygame.time.get_ticks()
-            if not self.game_over and current_time - last_step_time > 50:
-                try:
-                    next(self.solver)
-                    last_step_time = current_time
-                    if self.board.check_win():
-                        self.game_over = True
-                except StopIteration:
-                    self.game_over = True
+            if not self.game_over:
+                self.advance_solver()
             self.draw()
-            clock.tick(30)
+            self.clock.tick(self.fps)
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Watch the Sudoku solver fill in a generated puzzle")
+    parser.add_argument("--steps-per-frame", type=int, default=1,
+                        help="Solver steps per frame (0 = no limit, use --frame-budget-ms)")
+    parser.add_argument("--frame-budget-ms", type=int, default=None,
+                        help="Stop stepping the solver once this much of a frame has been spent")
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--trace", metavar="PATH", default=None,
+                        help="Write solver events to this file as JSON lines")
+    args = parser.parse_args()
+    if args.trace:
+        with open(args.trace, 'w') as trace_file:
+            events = SolverEvents()
+            events.subscribe(EventWriter(trace_file))
+            Game(args.steps_per_frame or None, args.frame_budget_ms, args.fps, events).run()
+    else:
+        game = Game(args.steps_per_frame or None, args.frame_budget_ms, args.fps)
+        game.run()
@@ -0,0 +1,282 @@
+import argparse
+import cProfile
+import csv
+import functools
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import time
+import tracemalloc
+
+from SudokuBulk import _puzzle_lines
+from SudokuCore import (ANY_SIZE_SOLVERS, GRID_SIZE, SOLVERS, EventWriter, SolverEvents, SudokuBoard, format_grid,
+                        generate_puzzle, new_solver_stats, parse_grid, solve_grid)
+from SudokuDLX import format_sized_grid, parse_sized_grid, solve_dlx
+
+# Well-known hard 9x9 puzzles (several from the top95 set, plus Arto Inkala's "world's hardest"),
+# so the benchmark runs without downloading anything. Pass files such as top95.txt or
+# top1465.txt for the full published sets.
+HARD_PUZZLES = [
+    "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+    "52...6.........7.13...........4..8..6......5...........418.........3..2...87.....",
+    "6.....8.3.4.7.................5.4.7.3..2.....1.6.......2.....5.....8.6......1....",
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "85...24..72......9..4.........1.7..23.5...9...4...........8..7..17..........36.4.",
+    "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97..",
+    "12.3....435....1....4........54..2..6...7.........8.9...31..5.......9.7.....6...8",
+]
+# Minimal puzzles from Gordon Royle's collection of 17-clue Sudokus.
+SEVENTEEN_CLUE_PUZZLES = [
+    ".......1.4.........2...........5.4.7..8...3....1.9....3..4..2...5.1........8.6...",
+    ".......12.5.4............3.7..6..4....1..........8....92....8.....51.7.......3...",
+    ".......12....35......6...7.7.....3.....4..8..1...........12.....8.....4..5....6..",
+]
+# Built to defeat brute force: the solution's first row is 987654321, so a solver
+# that tries digits in ascending order explores almost every wrong branch first.
+BRUTE_FORCE_ADVERSARY = "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9"
+DEFAULT_BLANK_FRACTION = 0.45
+DEFAULT_EASY_COUNT = 10
+PROFILE_PATTERN = "find_mrv_cell|find_best_empty_cell|is_valid|candidates|propagation_steps|cover"
+
+def random_puzzles(grid_size, count, blank_fraction=DEFAULT_BLANK_FRACTION, seed=0):
+    # Larger grids have no standard corpus, so blank random cells of DLX-generated solutions.
+    # Much past half blank, 25x25 grids fall into the heavy-tailed part of the search.
+    rng = random.Random(seed)
+    puzzles = []
+    for _ in range(count):
+        board = [[0] * grid_size for _ in range(grid_size)]
+        solve_dlx(board, rng=rng)
+        for index in rng.sample(range(grid_size * grid_size), int(blank_fraction * grid_size * grid_size)):
+            board[index // grid_size][index % grid_size] = 0
+        puzzles.append(format_sized_grid(board))
+    return puzzles
+
+def easy_puzzles(count=DEFAULT_EASY_COUNT, seed=0):
+    rng = random.Random(seed)
+    return [format_grid(generate_puzzle("easy", rng)) for _ in range(count)]
+
+def anti_backtracking(puzzle):
+    # Relabels digits so the solution's first row reads 987654321, the worst order for
+    # a solver that tries candidates from 1 upwards.
+    solution = parse_grid(puzzle)
+    solve_grid(solution)
+    relabel = {num: GRID_SIZE - col for col, num in enumerate(solution[0])}
+    return "".join(str(relabel[int(ch)]) if ch not in ".0" else "." for ch in puzzle)
+
+def builtin_corpora(sizes=(16, 25), count=5, seed=0):
+    corpora = {
+        "easy": easy_puzzles(seed=seed),
+        "hard": HARD_PUZZLES,
+        "17-clue": SEVENTEEN_CLUE_PUZZLES,
+        "adversarial": [BRUTE_FORCE_ADVERSARY] + [anti_backtracking(puzzle) for puzzle in HARD_PUZZLES],
+    }
+    for grid_size in sizes:
+        corpora[f"random-{grid_size}x{grid_size}"] = random_puzzles(grid_size, count, seed=seed)
+    return corpora
+
+def solve_with_steps(board, stats=None, events=None):
+    # The visualizer's path: SudokuBoard.solve_ai driven to completion.
+    sudoku = SudokuBoard(format_grid(board))
+    for _ in sudoku.solve_ai(events):
+        pass
+    if stats is not None:
+        for key, value in sudoku.solver_stats.items():
+            stats[key] += value
+    board[:] = sudoku.board
+    return sudoku.is_full()
+
+STRATEGIES = dict(SOLVERS, steps=solve_with_steps)
+
+def time_puzzle(strategy, puzzle, memory=False):
+    board = parse_sized_grid(puzzle)
+    stats = new_solver_stats()
+    if memory:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    start_time = time.perf_counter()
+    solved = STRATEGIES[strategy](board, stats)
+    elapsed = time.perf_counter() - start_time
+    return {
+        "solver": strategy,
+        "grid_size": len(board),
+        "clues": sum(1 for ch in puzzle if ch not in ".0"),
+        "solved": bool(solved),
+        "time_ms": elapsed * 1000,
+        "nodes": stats["nodes"],
+        "backtracks": stats["backtracks"],
+        "guesses": stats["guesses"],
+        "peak_kb": (tracemalloc.get_traced_memory()[1] - baseline) / 1024 if memory else None,
+    }
+
+def summarize(records):
+    times = [record["time_ms"] for record in records]
+    peaks = [record["peak_kb"] for record in records if record["peak_kb"] is not None]
+    return {
+        "puzzles": len(records),
+        "solved": sum(record["solved"] for record in records),
+        "total_s": sum(times) / 1000,
+        "mean_ms": sum(times) / len(times) if times else 0.0,
+        "max_ms": max(times) if times else 0.0,
+        "nodes": sum(record["nodes"] for record in records),
+        "backtracks": sum(record["backtracks"] for record in records),
+        "peak_kb": max(peaks) if peaks else None,
+    }
+
+def run_benchmark(puzzle_sets, solvers=None, memory=False):
+    solvers = solvers or sorted(STRATEGIES)
+    corpora = {}
+    records = []
+    if memory:
+        tracemalloc.start()
+    try:
+        for name, puzzles in puzzle_sets.items():
+            grid_size = len(parse_sized_grid(puzzles[0])) if puzzles else GRID_SIZE
+            corpora[name] = {"grid_size": grid_size, "solvers": {}}
+            for solver in solvers:
+                if grid_size != GRID_SIZE and solver not in ANY_SIZE_SOLVERS:
+                    corpora[name]["solvers"][solver] = None
+                    continue
+                solver_records = [dict(time_puzzle(solver, puzzle, memory), corpus=name, index=index)
+                                  for index, puzzle in enumerate(puzzles)]
+                corpora[name]["solvers"][solver] = summarize(solver_records)
+                records.extend(solver_records)
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "corpora": corpora,
+        "puzzles": records,
+    }
+
+def profile_benchmark(profiler, puzzle_sets, solvers=None, output=None):
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise SystemExit("pyinstrument is not installed (pip install pyinstrument)")
+        profile = Profiler()
+        profile.start()
+        report = run_benchmark(puzzle_sets, solvers)
+        profile.stop()
+        print(profile.output_text(unicode=True, color=False))
+        if output:
+            with open(output, 'w') as f:
+                f.write(profile.output_html())
+        return report
+
+    profile = cProfile.Profile()
+    report = profile.runcall(run_benchmark, puzzle_sets, solvers)
+    stream = io.StringIO()
+    # Only the hot helpers, so the numbers stay readable across versions.
+    pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(PROFILE_PATTERN)
+    print(stream.getvalue())
+    if output:
+        profile.dump_stats(output)
+    return report
+
+CSV_FIELDS = ("corpus", "index", "solver", "grid_size", "clues", "solved", "time_ms", "nodes", "backtracks",
+              "guesses", "peak_kb")
+
+def write_report(report, path):
+    with open(path, 'w', newline='') as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(report["puzzles"])
+        else:
+            json.dump(report, f, indent=2)
+
+def compare_reports(report, baseline):
+    # Mean time per corpus and solver relative to an earlier JSON report; above 1.0 is slower.
+    ratios = {}
+    for name, corpus in report["corpora"].items():
+        old_corpus = baseline.get("corpora", {}).get(name)
+        if old_corpus is None:
+            continue
+        for solver, summary in corpus["solvers"].items():
+            old = old_corpus["solvers"].get(solver)
+            if summary is not None and old is not None and old["mean_ms"] > 0:
+                ratios[(name, solver)] = summary["mean_ms"] / old["mean_ms"]
+    return ratios
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Sudoku solvers over puzzle corpora")
+    parser.add_argument("files", nargs="*",
+                        help="Puzzle files, one puzzle per line, used instead of the built-in corpora")
+    parser.add_argument("--corpora", nargs="+", default=None,
+                        help="Only run these built-in corpora (easy, hard, 17-clue, adversarial, random-NxN)")
+    parser.add_argument("--solvers", nargs="+", choices=sorted(STRATEGIES), default=None)
+    parser.add_argument("--sizes", nargs="*", type=int, default=[16, 25],
+                        help="Also benchmark random puzzles of these grid sizes")
+    parser.add_argument("--count", type=int, default=5, help="Random puzzles per extra grid size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true",
+                        help="Record peak traced memory per puzzle (much slower, so times are not comparable)")
+    parser.add_argument("--profile", choices=("cprofile", "pyinstrument"), default=None,
+                        help="Profile the run and print the hot solver functions")
+    parser.add_argument("--profile-output", default=None, help="Save the raw profile (.prof or .html)")
+    parser.add_argument("--output", default=None, help="Write the report to this path (.json, or .csv per puzzle)")
+    parser.add_argument("--compare", metavar="BASELINE", default=None,
+                        help="Compare mean times against an earlier JSON report")
+    parser.add_argument("--trace", metavar="PATH", default=None,
+                        help="Write the steps strategy's solver events to this file as JSON lines")
+    args = parser.parse_args()
+
+    if args.files:
+        puzzle_sets = {}
+        for path in args.files:
+            with open(path, 'r') as f:
+                puzzle_sets[os.path.basename(path)] = list(_puzzle_lines(f))
+    else:
+        puzzle_sets = builtin_corpora(args.sizes, args.count, args.seed)
+        if args.corpora:
+            puzzle_sets = {name: puzzle_sets[name] for name in args.corpora}
+
+    trace_file = events = None
+    if args.trace:
+        trace_file = open(args.trace, 'w')
+        events = SolverEvents()
+        events.subscribe(EventWriter(trace_file))
+        STRATEGIES["steps"] = functools.partial(solve_with_steps, events=events)
+    try:
+        if args.profile:
+            report = profile_benchmark(args.profile, puzzle_sets, args.solvers, args.profile_output)
+        else:
+            report = run_benchmark(puzzle_sets, args.solvers, args.memory)
+    finally:
+        if trace_file is not None:
+            trace_file.close()
+    if events is not None:
+        report["events"] = events.summary()
+
+    for name, result in report["corpora"].items():
+        print(f"{name} ({result['grid_size']}x{result['grid_size']}):")
+        for solver, timing in result["solvers"].items():
+            if timing is None:
+                print(f"  {solver:<13} n/a (only {GRID_SIZE}x{GRID_SIZE})")
+                continue
+            line = (f"  {solver:<13} {timing['solved']}/{timing['puzzles']} solved  "
+                    f"mean {timing['mean_ms']:.2f} ms  max {timing['max_ms']:.2f} ms  "
+                    f"nodes {timing['nodes']}  backtracks {timing['backtracks']}")
+            if timing["peak_kb"] is not None:
+                line += f"  peak {timing['peak_kb']:.0f} KB"
+            print(line)
+
+    if events is not None:
+        print(f"Solver events: {report['events']}")
+        print(f"Wrote events to '{args.trace}'.")
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            ratios = compare_reports(report, json.load(f))
+        print(f"Mean time vs '{args.compare}':")
+        for (name, solver), ratio in sorted(ratios.items()):
+            print(f"  {name:<14} {solver:<13} {ratio:.2f}x")
+    if args.output:
+        write_report(report, args.output)
+        print(f"Wrote report to '{args.output}'.")
@@ -0,0 +1,106 @@
+import argparse
+import collections
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from SudokuCore import DEFAULT_SOLVER, SOLVERS, solve_puzzle
+
+DEFAULT_CHUNK_SIZE = 256
+REPORT_INTERVAL = 5.0
+
+def solve_chunk(lines, solver=None):
+    solutions = []
+    for line in lines:
+        if not line:
+            # A blank or comment line still gets its (empty) output line.
+            solutions.append("")
+            continue
+        try:
+            solutions.append(solve_puzzle(line, solver))
+        except ValueError:
+            solutions.append(None)
+    return solutions
+
+def _chunks(lines, chunk_size):
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def solve_stream(lines, workers=0, chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None, solver=None):
+    if workers <= 0:
+        for chunk in _chunks(lines, chunk_size):
+            yield from solve_chunk(chunk, solver)
+        return
+
+    # Only a bounded window of chunks is in flight, so memory stays flat however long the input is.
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(executor.submit(solve_chunk, chunk, solver))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def _puzzle_lines(stream):
+    for line in stream:
+        line = line.strip()
+        yield "" if line.startswith("#") else line
+
+def run(input_stream, output_stream, workers=0, chunk_size=DEFAULT_CHUNK_SIZE, quiet=False, solver=None):
+    solved = failed = skipped = 0
+    start_time = last_report = time.perf_counter()
+    for solution in solve_stream(_puzzle_lines(input_stream), workers, chunk_size, solver=solver):
+        if solution is None:
+            failed += 1
+            output_stream.write("\n")
+        elif not solution:
+            skipped += 1
+            output_stream.write("\n")
+        else:
+            solved += 1
+            output_stream.write(solution + "\n")
+
+        now = time.perf_counter()
+        if not quiet and now - last_report >= REPORT_INTERVAL:
+            last_report = now
+            print(f"  ... {solved + failed} puzzles ({(solved + failed) / (now - start_time):.0f}/s)", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start_time
+    total = solved + failed
+    rate = total / elapsed if elapsed > 0 else 0.0
+    if not quiet:
+        print(f"Solved {solved}/{total} puzzles in {elapsed:.2f}s ({rate:.0f} puzzles/s), {failed} unsolvable or invalid, "
+              f"{skipped} blank or comment lines.",
+              file=sys.stderr)
+    return solved, failed, elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Solve Sudoku puzzles, one 81-character line each ('.' or '0' for blanks; 256 or 625 "
+                    "characters with letters for 16x16 and 25x25 under --solver dlx). "
+                    "Solutions are written in input order; unsolvable or invalid puzzles, blank lines and '#' comment "
+                    "lines each produce an empty line, so output line N answers input line N.")
+    parser.add_argument("input", nargs="?", default="-", help="Puzzle file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Solution file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = solve in this process)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Puzzles per worker task")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default=DEFAULT_SOLVER)
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress and throughput")
+    args = parser.parse_args()
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input, 'r')
+    output_stream = sys.stdout if args.output == "-" else open(args.output, 'w')
+    try:
+        run(input_stream, output_stream, args.workers, args.chunk_size, args.quiet, args.solver)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
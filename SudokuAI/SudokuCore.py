@@ -0,0 +1,734 @@
+import collections
+import json
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from SudokuDLX import count_solutions_dlx, format_sized_grid, parse_sized_grid, solve_dlx
+
+GRID_SIZE = 9
+BOX_SIZE = 3
+ALL_CANDIDATES = (1 << GRID_SIZE) - 1
+POPCOUNT = [bin(mask).count("1") for mask in range(1 << GRID_SIZE)]
+
+def box_index(row, col):
+    return (row // BOX_SIZE) * BOX_SIZE + col // BOX_SIZE
+
+BOX_OF = [[box_index(row, col) for col in range(GRID_SIZE)] for row in range(GRID_SIZE)]
+
+# Digit n is bit n-1 of each mask; rows/cols/boxes hold the digits already used.
+class CandidateMasks:
+    def __init__(self, board):
+        self.rows = [0] * GRID_SIZE
+        self.cols = [0] * GRID_SIZE
+        self.boxes = [0] * GRID_SIZE
+        self.filled = 0
+        for row in range(GRID_SIZE):
+            for col in range(GRID_SIZE):
+                if board[row][col] != 0:
+                    self.place(row, col, board[row][col])
+
+    def place(self, row, col, num):
+        bit = 1 << (num - 1)
+        self.rows[row] |= bit
+        self.cols[col] |= bit
+        self.boxes[BOX_OF[row][col]] |= bit
+        self.filled += 1
+
+    def unplace(self, row, col, num):
+        bit = ~(1 << (num - 1))
+        self.rows[row] &= bit
+        self.cols[col] &= bit
+        self.boxes[BOX_OF[row][col]] &= bit
+        self.filled -= 1
+
+    def candidates(self, row, col):
+        return ALL_CANDIDATES & ~(self.rows[row] | self.cols[col] | self.boxes[BOX_OF[row][col]])
+
+    def is_valid(self, row, col, num):
+        return self.candidates(row, col) & (1 << (num - 1)) != 0
+
+def find_mrv_cell(board, masks, eliminated=None):
+    best = None
+    min_poss = GRID_SIZE + 1
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            if board[row][col] == 0:
+                candidates = masks.candidates(row, col)
+                if eliminated is not None:
+                    candidates &= ~eliminated[row * GRID_SIZE + col]
+                count = POPCOUNT[candidates]
+                if count < min_poss:
+                    min_poss = count
+                    best = (row, col, candidates)
+                    if count == 0:
+                        return best
+    return best
+
+ROW_CELLS = [[(row, col) for col in range(GRID_SIZE)] for row in range(GRID_SIZE)]
+COL_CELLS = [[(row, col) for row in range(GRID_SIZE)] for col in range(GRID_SIZE)]
+BOX_CELLS = [[(row, col) for row in range(GRID_SIZE) for col in range(GRID_SIZE) if box_index(row, col) == box]
+             for box in range(GRID_SIZE)]
+# (kind, index, cells) for every row, column and box.
+UNITS = ([("row", i, cells) for i, cells in enumerate(ROW_CELLS)] +
+         [("col", i, cells) for i, cells in enumerate(COL_CELLS)] +
+         [("box", i, cells) for i, cells in enumerate(BOX_CELLS)])
+TECHNIQUES = ("naked_single", "hidden_single", "pointing", "box_line", "naked_pair", "hidden_pair")
+
+# "nodes" counts every digit a solver places on a blank cell (guesses and logical placements
+# alike, including ones later undone), so it measures the same work for every solver.
+def new_solver_stats():
+    stats = {technique: 0 for technique in TECHNIQUES}
+    stats["nodes"] = 0
+    stats["guesses"] = 0
+    stats["backtracks"] = 0
+    return stats
+
+def _cell_candidates(masks, eliminated, row, col):
+    return masks.candidates(row, col) & ~eliminated[row * GRID_SIZE + col]
+
+def _unit_used(masks, kind, index):
+    if kind == "row":
+        return masks.rows[index]
+    if kind == "col":
+        return masks.cols[index]
+    return masks.boxes[index]
+
+def _eliminate(board, masks, eliminated, cells, bits):
+    changed = False
+    for row, col in cells:
+        if board[row][col] == 0 and _cell_candidates(masks, eliminated, row, col) & bits:
+            eliminated[row * GRID_SIZE + col] |= bits
+            changed = True
+    return changed
+
+def _apply_intersections(board, masks, eliminated, stats):
+    for box, cells in enumerate(BOX_CELLS):
+        for num in _candidate_digits(ALL_CANDIDATES & ~masks.boxes[box]):
+            bit = 1 << (num - 1)
+            spots = [(r, c) for r, c in cells if board[r][c] == 0 and _cell_candidates(masks, eliminated, r, c) & bit]
+            rows = {r for r, _ in spots}
+            cols = {c for _, c in spots}
+            if len(rows) == 1:
+                others = [cell for cell in ROW_CELLS[rows.pop()] if box_index(*cell) != box]
+                if _eliminate(board, masks, eliminated, others, bit):
+                    stats["pointing"] += 1
+                    return True
+            if len(cols) == 1:
+                others = [cell for cell in COL_CELLS[cols.pop()] if box_index(*cell) != box]
+                if _eliminate(board, masks, eliminated, others, bit):
+                    stats["pointing"] += 1
+                    return True
+
+    for kind, index, cells in UNITS[:2 * GRID_SIZE]:
+        for num in _candidate_digits(ALL_CANDIDATES & ~_unit_used(masks, kind, index)):
+            bit = 1 << (num - 1)
+            boxes = {box_index(r, c) for r, c in cells
+                     if board[r][c] == 0 and _cell_candidates(masks, eliminated, r, c) & bit}
+            if len(boxes) == 1:
+                others = [cell for cell in BOX_CELLS[boxes.pop()] if cell not in cells]
+                if _eliminate(board, masks, eliminated, others, bit):
+                    stats["box_line"] += 1
+                    return True
+    return False
+
+def _apply_pairs(board, masks, eliminated, stats):
+    for kind, index, cells in UNITS:
+        empty = [(r, c) for r, c in cells if board[r][c] == 0]
+        pairs = {}
+        for row, col in empty:
+            candidates = _cell_candidates(masks, eliminated, row, col)
+            if POPCOUNT[candidates] == 2:
+                if candidates in pairs:
+                    others = [cell for cell in empty if cell != (row, col) and cell != pairs[candidates]]
+                    if _eliminate(board, masks, eliminated, others, candidates):
+                        stats["naked_pair"] += 1
+                        return True
+                else:
+                    pairs[candidates] = (row, col)
+
+        spots_by_digit = {}
+        for num in _candidate_digits(ALL_CANDIDATES & ~_unit_used(masks, kind, index)):
+            bit = 1 << (num - 1)
+            spots = tuple(cell for cell in empty if _cell_candidates(masks, eliminated, *cell) & bit)
+            if len(spots) == 2:
+                if spots in spots_by_digit:
+                    pair_bits = bit | spots_by_digit[spots]
+                    if _eliminate(board, masks, eliminated, spots, ALL_CANDIDATES & ~pair_bits):
+                        stats["hidden_pair"] += 1
+                        return True
+                else:
+                    spots_by_digit[spots] = bit
+    return False
+
+def propagation_steps(board, masks, eliminated, stats, trail, eliminations=True):
+    # Applies the easiest technique that makes progress, then starts over, until a fixed
+    # point; yields every placement and returns False on a contradiction. Without
+    # eliminations only singles are used, which is cheaper when no grading is needed.
+    while True:
+        progress = False
+        for row in range(GRID_SIZE):
+            for col in range(GRID_SIZE):
+                if board[row][col] == 0:
+                    candidates = _cell_candidates(masks, eliminated, row, col)
+                    if candidates == 0:
+                        return False
+                    if POPCOUNT[candidates] == 1:
+                        num = candidates.bit_length()
+                        board[row][col] = num
+                        masks.place(row, col, num)
+                        trail.append((row, col, num))
+                        stats["naked_single"] += 1
+                        stats["nodes"] += 1
+                        progress = True
+                        yield (row, col, num)
+        if progress:
+            continue
+
+        for kind, index, cells in UNITS:
+            once = twice = 0
+            for row, col in cells:
+                if board[row][col] == 0:
+                    candidates = _cell_candidates(masks, eliminated, row, col)
+                    twice |= once & candidates
+                    once |= candidates
+            if ALL_CANDIDATES & ~(once | _unit_used(masks, kind, index)):
+                return False
+            single = once & ~twice
+            if single:
+                bit = single & -single
+                row, col = next((r, c) for r, c in cells
+                                if board[r][c] == 0 and _cell_candidates(masks, eliminated, r, c) & bit)
+                num = bit.bit_length()
+                board[row][col] = num
+                masks.place(row, col, num)
+                trail.append((row, col, num))
+                stats["hidden_single"] += 1
+                stats["nodes"] += 1
+                progress = True
+                yield (row, col, num)
+                break
+        if progress:
+            continue
+
+        if eliminations and _apply_intersections(board, masks, eliminated, stats):
+            continue
+        if eliminations and _apply_pairs(board, masks, eliminated, stats):
+            continue
+        return True
+
+def propagate(board, masks, eliminated, stats, trail, eliminations=True):
+    steps = propagation_steps(board, masks, eliminated, stats, trail, eliminations)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+def _undo_trail(board, masks, trail):
+    for row, col, num in reversed(trail):
+        masks.unplace(row, col, num)
+        board[row][col] = 0
+
+def _solve_with_logic(board, masks, eliminated, stats):
+    saved = eliminated[:]
+    trail = []
+    if propagate(board, masks, eliminated, stats, trail):
+        cell = find_mrv_cell(board, masks, eliminated)
+        if not cell:
+            return True
+
+        row, col, candidates = cell
+        for num in _candidate_digits(candidates):
+            branch_saved = eliminated[:]
+            board[row][col] = num
+            masks.place(row, col, num)
+            stats["nodes"] += 1
+            stats["guesses"] += 1
+
+            if _solve_with_logic(board, masks, eliminated, stats):
+                return True
+
+            masks.unplace(row, col, num)
+            board[row][col] = 0
+            eliminated[:] = branch_saved
+            stats["backtracks"] += 1
+
+    _undo_trail(board, masks, trail)
+    eliminated[:] = saved
+    return False
+
+def _count_with_logic(board, masks, eliminated, limit, stats):
+    saved = eliminated[:]
+    trail = []
+    count = 0
+    if propagate(board, masks, eliminated, stats, trail, eliminations=False):
+        cell = find_mrv_cell(board, masks, eliminated)
+        if not cell:
+            count = 1
+        else:
+            row, col, candidates = cell
+            for num in _candidate_digits(candidates):
+                branch_saved = eliminated[:]
+                board[row][col] = num
+                masks.place(row, col, num)
+                count += _count_with_logic(board, masks, eliminated, limit - count, stats)
+                masks.unplace(row, col, num)
+                board[row][col] = 0
+                eliminated[:] = branch_saved
+                if count >= limit:
+                    break
+
+    _undo_trail(board, masks, trail)
+    eliminated[:] = saved
+    return count
+
+def solve_with_logic(board, stats=None):
+    masks = masks_for_givens(board)
+    if masks is None:
+        return False
+    return _solve_with_logic(board, masks, [0] * (GRID_SIZE * GRID_SIZE),
+                             stats if stats is not None else new_solver_stats())
+
+def parse_grid(text):
+    text = text.strip()
+    if len(text) != GRID_SIZE * GRID_SIZE:
+        raise ValueError(f"Puzzle must have {GRID_SIZE * GRID_SIZE} cells, got {len(text)}")
+    cells = []
+    for ch in text:
+        if ch in ".0":
+            cells.append(0)
+        elif ch.isdigit():
+            cells.append(int(ch))
+        else:
+            raise ValueError(f"Invalid puzzle character {ch!r}")
+    return [cells[row * GRID_SIZE:(row + 1) * GRID_SIZE] for row in range(GRID_SIZE)]
+
+def format_grid(board):
+    return "".join(str(num) for row in board for num in row)
+
+def masks_for_givens(board):
+    masks = CandidateMasks([[0] * GRID_SIZE for _ in range(GRID_SIZE)])
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            num = board[row][col]
+            if num != 0:
+                if not masks.is_valid(row, col, num):
+                    return None
+                masks.place(row, col, num)
+    return masks
+
+def solve_grid(board, solver=None, stats=None):
+    return SOLVERS[solver or DEFAULT_SOLVER](board, stats)
+
+def solve_with_backtracking(board, stats=None):
+    masks = masks_for_givens(board)
+    return masks is not None and _solve_with_masks(board, masks, stats=stats)
+
+def _candidate_digits(candidates):
+    digits = []
+    while candidates:
+        bit = candidates & -candidates
+        candidates ^= bit
+        digits.append(bit.bit_length())
+    return digits
+
+def _solve_with_masks(board, masks, rng=None, stats=None):
+    cell = find_mrv_cell(board, masks)
+    if not cell:
+        return True
+
+    row, col, candidates = cell
+    digits = _candidate_digits(candidates)
+    if rng is not None:
+        rng.shuffle(digits)
+    for num in digits:
+        board[row][col] = num
+        masks.place(row, col, num)
+        if stats is not None:
+            stats["nodes"] += 1
+
+        if _solve_with_masks(board, masks, rng, stats):
+            return True
+
+        masks.unplace(row, col, num)
+        board[row][col] = 0
+        if stats is not None:
+            stats["backtracks"] += 1
+
+    return False
+
+def count_solutions(board, limit=2):
+    # The logic counter is 9x9 only; exact cover checks uniqueness on 16x16 and 25x25 grids.
+    if len(board) != GRID_SIZE:
+        return count_solutions_dlx(board, limit)
+    board = [row[:] for row in board]
+    masks = masks_for_givens(board)
+    if masks is None:
+        return 0
+    return _count_with_logic(board, masks, [0] * (GRID_SIZE * GRID_SIZE), limit, new_solver_stats())
+
+# Every solver fills a list-of-lists board in place and returns whether it found a solution;
+# stats, if given, is a dict from new_solver_stats(). Only DLX handles grids other than 9x9.
+SOLVERS = {
+    "logic": solve_with_logic,
+    "backtracking": solve_with_backtracking,
+    "dlx": solve_dlx,
+}
+DEFAULT_SOLVER = "logic"
+ANY_SIZE_SOLVERS = ("dlx",)
+
+def solve_puzzle(text, solver=None):
+    solver = solver or DEFAULT_SOLVER
+    board = parse_sized_grid(text)
+    if len(board) != GRID_SIZE and solver not in ANY_SIZE_SOLVERS:
+        raise ValueError(f"The '{solver}' solver only handles {GRID_SIZE}x{GRID_SIZE} grids")
+    return format_sized_grid(board) if solve_grid(board, solver) else None
+
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+DEFAULT_CELLS_TO_REMOVE = 45
+
+def random_solution(rng=random):
+    board = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
+    _solve_with_masks(board, CandidateMasks(board), rng)
+    return board
+
+def rate_puzzle(board):
+    stats = new_solver_stats()
+    stats["solved"] = solve_with_logic([row[:] for row in board], stats)
+    stats["clues"] = sum(1 for row in board for num in row if num != 0)
+    stats["difficulty"] = difficulty_for(stats)
+    return stats
+
+# A puzzle is as hard as the hardest technique it needs: singles, then intersections,
+# then pairs, then guessing.
+def difficulty_for(stats):
+    if stats["guesses"] > 0:
+        return "expert"
+    if stats["naked_pair"] > 0 or stats["hidden_pair"] > 0:
+        return "hard"
+    if stats["pointing"] > 0 or stats["box_line"] > 0:
+        return "medium"
+    return "easy"
+
+def dig_puzzle(solution, rng=random, max_removed=GRID_SIZE * GRID_SIZE):
+    puzzle = [row[:] for row in solution]
+    positions = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
+    rng.shuffle(positions)
+    removed = 0
+    for row, col in positions:
+        if removed >= max_removed:
+            break
+        num = puzzle[row][col]
+        puzzle[row][col] = 0
+        if count_solutions(puzzle, 2) == 1:
+            removed += 1
+        else:
+            puzzle[row][col] = num
+    return puzzle
+
+def generate_puzzle(difficulty=None, rng=random, max_attempts=50):
+    if difficulty is None:
+        return dig_puzzle(random_solution(rng), rng, DEFAULT_CELLS_TO_REMOVE)
+
+    target = DIFFICULTIES.index(difficulty)
+    for _ in range(max_attempts):
+        solution = random_solution(rng)
+        # A minimal puzzle is the hardest this grid can give; add givens back until it is easy enough.
+        puzzle = dig_puzzle(solution, rng)
+        level = DIFFICULTIES.index(rate_puzzle(puzzle)["difficulty"])
+        if level < target:
+            continue
+
+        empty = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE) if puzzle[r][c] == 0]
+        rng.shuffle(empty)
+        for row, col in empty:
+            if level == target:
+                return puzzle
+            puzzle[row][col] = solution[row][col]
+            level = DIFFICULTIES.index(rate_puzzle(puzzle)["difficulty"])
+        if level == target:
+            return puzzle
+
+    raise RuntimeError(f"Could not generate a '{difficulty}' puzzle in {max_attempts} attempts")
+
+NUM_CELLS = GRID_SIZE * GRID_SIZE
+GIVENS_BYTES = (NUM_CELLS + 7) // 8
+# bytes.translate tables between the 81-character text form and cell values; 255 marks an invalid character.
+_TEXT_TO_CELL = bytes(ch - ord("0") if ch in b"0123456789" else 0 if ch == ord(".") else 255 for ch in range(256))
+_CELL_TO_TEXT = bytes(ord("0") + num if num <= 9 else ord("?") for num in range(256))
+_TEXT_TO_GIVEN = str.maketrans("0.123456789", "00111111111")
+
+# One byte per cell plus an int bitmask of givens (bit i is cell i), for holding many boards
+# at once: a copy is a memcpy and a snapshot is an immutable 81-byte bytes object.
+class CompactBoard:
+    __slots__ = ("cells", "givens")
+
+    def __init__(self, cells=None, givens=0):
+        self.cells = bytearray(NUM_CELLS) if cells is None else cells
+        self.givens = givens
+
+    @classmethod
+    def from_string(cls, text):
+        text = text.strip()
+        if len(text) != NUM_CELLS:
+            raise ValueError(f"Puzzle must have {NUM_CELLS} cells, got {len(text)}")
+        cells = bytearray(text.encode("ascii", "replace").translate(_TEXT_TO_CELL))
+        if 255 in cells:
+            raise ValueError(f"Invalid puzzle character in {text!r}")
+        return cls(cells, int(text.translate(_TEXT_TO_GIVEN)[::-1], 2))
+
+    @classmethod
+    def from_rows(cls, board, original=None):
+        cells = bytearray(num for row in board for num in row)
+        givens = 0
+        for index, num in enumerate(num for row in (original or board) for num in row):
+            if num != 0:
+                givens |= 1 << index
+        return cls(cells, givens)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(bytearray(data[:NUM_CELLS]), int.from_bytes(data[NUM_CELLS:], "little"))
+
+    def to_string(self):
+        return self.cells.translate(_CELL_TO_TEXT).decode("ascii")
+
+    def givens_string(self):
+        return "".join(str(num) if self.givens >> index & 1 else "0" for index, num in enumerate(self.cells))
+
+    def to_rows(self):
+        return [list(self.cells[row * GRID_SIZE:(row + 1) * GRID_SIZE]) for row in range(GRID_SIZE)]
+
+    def to_bytes(self):
+        return bytes(self.cells) + self.givens.to_bytes(GIVENS_BYTES, "little")
+
+    def as_array(self):
+        # A zero-copy NumPy uint8 view of the cells, when NumPy is installed.
+        if np is None:
+            return None
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(GRID_SIZE, GRID_SIZE)
+
+    def copy(self):
+        return CompactBoard(bytearray(self.cells), self.givens)
+
+    def snapshot(self):
+        return bytes(self.cells)
+
+    def restore(self, snapshot):
+        self.cells[:] = snapshot
+
+    def get(self, row, col):
+        return self.cells[row * GRID_SIZE + col]
+
+    def set(self, row, col, num):
+        index = row * GRID_SIZE + col
+        if self.givens >> index & 1:
+            raise ValueError(f"Cell ({row}, {col}) is a given")
+        self.cells[index] = num
+
+    def is_given(self, row, col):
+        return self.givens >> (row * GRID_SIZE + col) & 1 == 1
+
+    def __eq__(self, other):
+        return isinstance(other, CompactBoard) and self.cells == other.cells and self.givens == other.givens
+
+# Structured events from SudokuBoard.solve_ai(events=...): start, place, undo, branch and
+# finish dicts, each stamped with seconds since the stream was created. Subscribers are
+# plain callables; without a stream the solver only pays an `is None` check per branch.
+class SolverEvents:
+    def __init__(self):
+        self.subscribers = []
+        self.start_time = time.perf_counter()
+        self.counts = collections.Counter()
+        self.branch_candidates = collections.Counter()
+        self.max_depth = 0
+        self.step_time_us = 0.0
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    def emit(self, event):
+        event["t"] = time.perf_counter() - self.start_time
+        kind = event["event"]
+        self.counts[event.get("source", kind) if kind in ("place", "undo") else kind] += 1
+        if kind == "branch":
+            self.branch_candidates[event["candidates"]] += 1
+        if "depth" in event and event["depth"] > self.max_depth:
+            self.max_depth = event["depth"]
+        if "step_us" in event:
+            self.step_time_us += event["step_us"]
+        for callback in self.subscribers:
+            callback(event)
+
+    def summary(self):
+        return {
+            "counts": dict(self.counts),
+            "branch_candidates": dict(sorted(self.branch_candidates.items())),
+            "max_depth": self.max_depth,
+            "step_time_ms": self.step_time_us / 1000,
+        }
+
+# Subscriber that appends every event to a stream as one JSON object per line.
+class EventWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __call__(self, event):
+        self.stream.write(json.dumps(event) + "\n")
+
+class SudokuBoard:
+    def __init__(self, puzzle=None):
+        self.board = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        self.original = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+        self.selected_cell = None
+        if puzzle is None:
+            self.generate_board()
+        else:
+            self.load_puzzle(puzzle)
+        self.save_original()
+    
+    def load_puzzle(self, puzzle):
+        self.board = parse_grid(puzzle)
+        self.masks = CandidateMasks(self.board)
+    
+    def save_original(self):
+        self.original = [row[:] for row in self.board]
+    
+    def to_compact(self):
+        return CompactBoard.from_rows(self.board, self.original)
+    
+    @classmethod
+    def from_compact(cls, compact):
+        sudoku = cls(compact.givens_string())
+        for index, num in enumerate(compact.cells):
+            if num != 0 and not compact.givens >> index & 1:
+                sudoku.set_cell(index // GRID_SIZE, index % GRID_SIZE, num)
+        return sudoku
+    
+    def is_original(self, row, col):
+        return self.original[row][col] != 0
+    
+    def set_cell(self, row, col, num):
+        old = self.board[row][col]
+        if old != 0:
+            self.masks.unplace(row, col, old)
+        self.board[row][col] = num
+        if num != 0:
+            self.masks.place(row, col, num)
+    
+    def is_valid_move(self, row, col, num):
+        return self.masks.is_valid(row, col, num)
+    
+    def solve_board(self, board, solver=None):
+        return solve_grid(board, solver)
+    
+    def generate_board(self, difficulty=None):
+        self.board = generate_puzzle(difficulty)
+        self.masks = CandidateMasks(self.board)
+    
+    def find_best_empty_cell(self):
+        cell = find_mrv_cell(self.board, self.masks)
+        return (cell[0], cell[1]) if cell else None
+    
+    def solve_ai(self, events=None):
+        self.eliminated = [0] * (GRID_SIZE * GRID_SIZE)
+        self.solver_stats = new_solver_stats()
+        self.events = events
+        self.depth = 0
+        if events is None:
+            return (yield from self._solve_steps())
+        return (yield from self._traced_steps(events))
+    
+    def _traced_steps(self, events):
+        stats = self.solver_stats
+        steps = self._solve_steps()
+        events.emit({"event": "start", "clues": sum(1 for row in self.original for num in row if num != 0),
+                     "empty": GRID_SIZE * GRID_SIZE - self.masks.filled})
+        while True:
+            singles, guesses, backtracks = stats["naked_single"], stats["guesses"], stats["backtracks"]
+            resumed = time.perf_counter()
+            try:
+                step = next(steps)
+            except StopIteration as stop:
+                solved = stop.value
+                break
+            step_us = (time.perf_counter() - resumed) * 1e6
+            row, col, num = step
+            if num == 0:
+                source = "backtrack" if stats["backtracks"] != backtracks else "unwind"
+                event = {"event": "undo", "row": row, "col": col}
+            else:
+                if stats["guesses"] != guesses:
+                    source = "guess"
+                elif stats["naked_single"] != singles:
+                    source = "naked_single"
+                else:
+                    source = "hidden_single"
+                event = {"event": "place", "row": row, "col": col, "num": num}
+            event.update(source=source, depth=self.depth, step_us=step_us)
+            events.emit(event)
+            yield step
+        events.emit({"event": "finish", "solved": solved, "stats": dict(stats)})
+        return solved
+    
+    def _solve_steps(self, depth=0):
+        self.depth = depth
+        saved = self.eliminated[:]
+        trail = []
+        consistent = yield from propagation_steps(self.board, self.masks, self.eliminated, self.solver_stats, trail)
+        if consistent:
+            cell = find_mrv_cell(self.board, self.masks, self.eliminated)
+            if not cell:
+                return True
+            
+            row, col, candidates = cell
+            if self.events is not None:
+                self.events.emit({"event": "branch", "row": row, "col": col, "candidates": POPCOUNT[candidates],
+                                  "depth": depth})
+            for num in _candidate_digits(candidates):
+                branch_saved = self.eliminated[:]
+                self.set_cell(row, col, num)
+                self.solver_stats["nodes"] += 1
+                self.solver_stats["guesses"] += 1
+                self.depth = depth + 1
+                yield (row, col, num)
+                if (yield from self._solve_steps(depth + 1)):
+                    return True
+                self.depth = depth
+                self.set_cell(row, col, 0)
+                self.eliminated[:] = branch_saved
+                self.solver_stats["backtracks"] += 1
+                yield (row, col, 0)
+        
+        for row, col, _ in reversed(trail):
+            self.set_cell(row, col, 0)
+            yield (row, col, 0)
+        self.eliminated[:] = saved
+        return False
+    
+    def is_full(self):
+        # The solver only places digits the masks allow, so once it has filled the board it is solved.
+        return self.masks.filled == GRID_SIZE * GRID_SIZE
+    
+    def check_win(self):
+        for row in self.board:
+            if set(row) != set(range(1, 10)):
+                return False
+        for col in range(9):
+            if set(self.board[row][col] for row in range(9)) != set(range(1, 10)):
+                return False
+        for box_row in range(0, 9, 3):
+            for box_col in range(0, 9, 3):
+                box = [self.board[r][c] for r in range(box_row, box_row+3) for c in range(box_col, box_col+3)]
+                if set(box) != set(range(1, 10)):
+                    return False
+        return True
@@ -0,0 +1,224 @@
+import math
+
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+
+def box_size_for(grid_size):
+    box_size = math.isqrt(grid_size)
+    if box_size < 2 or box_size * box_size != grid_size or grid_size > len(SYMBOLS):
+        raise ValueError(f"Grid size must be a square between 4 and {len(SYMBOLS)}, got {grid_size}")
+    return box_size
+
+# Dancing links over flat arrays instead of node objects. Node 0 is the root, nodes
+# 1..num_columns are the column headers, and every other node is a 1 in some row.
+class ExactCover:
+    def __init__(self, num_columns):
+        headers = range(num_columns + 1)
+        self.left = [i - 1 for i in headers]
+        self.left[0] = num_columns
+        self.right = [i + 1 for i in headers]
+        self.right[num_columns] = 0
+        self.up = list(headers)
+        self.down = list(headers)
+        self.column = list(headers)
+        self.size = [0] * (num_columns + 1)
+        self.row_of = [None] * (num_columns + 1)
+        self.first_node = {}
+
+    def add_row(self, row_id, columns):
+        first = None
+        for col in columns:
+            header = col + 1
+            node = len(self.column)
+            self.column.append(header)
+            self.row_of.append(row_id)
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.size[header] += 1
+            if first is None:
+                first = node
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+        self.first_node[row_id] = first
+
+    def cover(self, header):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def uncover(self, header):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def select(self, row_id):
+        # Commits to a row up front (a given); False if it clashes with an earlier selection.
+        first = self.first_node.get(row_id)
+        if first is None:
+            return False
+        node = first
+        while True:
+            header = self.column[node]
+            if self.right[self.left[header]] != header:
+                return False
+            self.cover(header)
+            node = self.right[node]
+            if node == first:
+                return True
+
+    def solve(self, limit=1, stats=None, rng=None):
+        solutions = []
+        self._search([], solutions, limit, stats, rng)
+        return solutions
+
+    def _search(self, partial, solutions, limit, stats, rng):
+        right, left, down, size, column = self.right, self.left, self.down, self.size, self.column
+        if right[0] == 0:
+            solutions.append(partial[:])
+            return len(solutions) >= limit
+
+        # Knuth's S heuristic: branch on the column with the fewest remaining rows.
+        best = header = right[0]
+        best_size = size[header]
+        while header != 0 and best_size > 0:
+            if size[header] < best_size:
+                best, best_size = header, size[header]
+            header = right[header]
+        if best_size == 0:
+            return False
+
+        self.cover(best)
+        rows = []
+        node = down[best]
+        while node != best:
+            rows.append(node)
+            node = down[node]
+        if rng is not None:
+            rng.shuffle(rows)
+
+        done = False
+        for node in rows:
+            partial.append(self.row_of[node])
+            j = right[node]
+            while j != node:
+                self.cover(column[j])
+                j = right[j]
+            if stats is not None:
+                stats["nodes"] += 1
+
+            done = self._search(partial, solutions, limit, stats, rng)
+
+            j = left[node]
+            while j != node:
+                self.uncover(column[j])
+                j = left[j]
+            partial.pop()
+            if done:
+                break
+            if stats is not None:
+                stats["backtracks"] += 1
+
+        self.uncover(best)
+        return done
+
+def sudoku_cover(board):
+    # One column per cell, row/digit, column/digit and box/digit constraint; one row per
+    # (row, col, digit) placement not already ruled out by the givens.
+    grid_size = len(board)
+    box_size = box_size_for(grid_size)
+    cells = grid_size * grid_size
+    used_rows = [set() for _ in range(grid_size)]
+    used_cols = [set() for _ in range(grid_size)]
+    used_boxes = [set() for _ in range(grid_size)]
+    givens = []
+    for row in range(grid_size):
+        for col in range(grid_size):
+            num = board[row][col]
+            if num != 0:
+                box = (row // box_size) * box_size + col // box_size
+                used_rows[row].add(num)
+                used_cols[col].add(num)
+                used_boxes[box].add(num)
+                givens.append((row, col, num))
+
+    cover = ExactCover(4 * cells)
+    for row in range(grid_size):
+        for col in range(grid_size):
+            box = (row // box_size) * box_size + col // box_size
+            given = board[row][col]
+            if given != 0:
+                nums = [given]
+            else:
+                taken = used_rows[row] | used_cols[col] | used_boxes[box]
+                nums = [num for num in range(1, grid_size + 1) if num not in taken]
+            for num in nums:
+                digit = num - 1
+                cover.add_row((row, col, num), (row * grid_size + col,
+                                                cells + row * grid_size + digit,
+                                                2 * cells + col * grid_size + digit,
+                                                3 * cells + box * grid_size + digit))
+
+    for given in givens:
+        if not cover.select(given):
+            return None
+    return cover
+
+def solve_dlx(board, stats=None, rng=None):
+    cover = sudoku_cover(board)
+    if cover is None:
+        return False
+    solutions = cover.solve(1, stats, rng)
+    if not solutions:
+        return False
+    for row, col, num in solutions[0]:
+        board[row][col] = num
+    return True
+
+def count_solutions_dlx(board, limit=2):
+    cover = sudoku_cover(board)
+    return 0 if cover is None else len(cover.solve(limit))
+
+def parse_sized_grid(text):
+    # 81, 256 or 625 characters (or 16 for 4x4); digits 1-9 then letters A-P, '.' or '0' for blanks.
+    text = text.strip()
+    grid_size = math.isqrt(len(text))
+    if grid_size * grid_size != len(text):
+        raise ValueError(f"Puzzle length {len(text)} is not a square grid")
+    box_size_for(grid_size)
+    symbols = SYMBOLS[:grid_size]
+    cells = []
+    for ch in text.upper():
+        if ch in ".0":
+            cells.append(0)
+        elif ch in symbols:
+            cells.append(symbols.index(ch) + 1)
+        else:
+            raise ValueError(f"Invalid puzzle character {ch!r} for a {grid_size}x{grid_size} grid")
+    return [cells[row * grid_size:(row + 1) * grid_size] for row in range(grid_size)]
+
+def format_sized_grid(board):
+    return "".join(SYMBOLS[num - 1] if num else "0" for row in board for num in row)
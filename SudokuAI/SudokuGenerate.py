@@ -0,0 +1,47 @@
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from SudokuCore import DIFFICULTIES, format_grid, generate_puzzle
+
+DEFAULT_CHUNK_SIZE = 16
+
+def generate_chunk(seed, count, difficulty):
+    rng = random.Random(seed)
+    return [format_grid(generate_puzzle(difficulty, rng)) for _ in range(count)]
+
+def generate_puzzles(count, difficulty=None, workers=0, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    base_seed = random.randrange(2 ** 32) if seed is None else seed
+    chunks = [(base_seed + i, min(chunk_size, count - start), difficulty)
+              for i, start in enumerate(range(0, count, chunk_size))]
+    if workers <= 0:
+        for chunk in chunks:
+            yield from generate_chunk(*chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for puzzles in executor.map(generate_chunk, *zip(*chunks)):
+            yield from puzzles
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate unique-solution Sudoku puzzles, one per line")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default=None,
+                        help="Target difficulty (default: remove up to 45 cells, keeping the solution unique)")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = generate in this process)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    output_stream = sys.stdout if args.output == "-" else open(args.output, 'w')
+    start_time = time.perf_counter()
+    try:
+        for puzzle in generate_puzzles(args.count, args.difficulty, args.workers, args.seed):
+            output_stream.write(puzzle + "\n")
+    finally:
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    elapsed = time.perf_counter() - start_time
+    print(f"Generated {args.count} puzzles in {elapsed:.2f}s ({args.count / elapsed:.1f} puzzles/s).", file=sys.stderr)
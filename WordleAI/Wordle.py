@@ -1,23 +1,47 @@
+import argparse
 import collections
+import glob
+import hashlib
+import json
+import math
 import os
 import random
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
 from typing import List
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 WORD_LENGTH = 5
 MAX_GUESSES = 6
 WORD_LIST_FILENAME = "words.txt"
 PRECOMPUTED_FIRST_GUESS = "CRANE"
+FEEDBACK_CACHE_SUFFIX = ".feedback"
+GUESS_SHARD_SIZE = 128
+# Bound on memoized get_feedback results; the full cross product of a large list would not fit.
+FEEDBACK_MEMO_SIZE = 1 << 16
+OPENING_BOOK_FILENAME = "opening_book.json"
+DEFAULT_BOOK_DEPTH = 3
 
 GREEN = 'G'
 YELLOW = 'Y'
 GRAY = 'X'
 
-def load_words(filename):
+# Feedback patterns are encoded as base-3 integers, first letter most significant.
+FEEDBACK_DIGITS = {GRAY: 0, YELLOW: 1, GREEN: 2}
+NUM_PATTERNS = 3 ** WORD_LENGTH
+
+def data_path(filename):
     script_dir = os.path.dirname(__file__)
-    filepath = os.path.join(script_dir, filename)
+    return os.path.join(script_dir, filename)
+
+def load_words(filename):
+    filepath = data_path(filename)
 
     if not os.path.exists(filepath):
         print(f"Error: Word list file '{filepath}' not found.")
@@ -38,9 +62,9 @@ def load_words(filename):
         sys.exit(1)
 
     print(f"Loaded {len(words)} valid words from '{filepath}'.")
-    return list(words)
+    return sorted(words)
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=FEEDBACK_MEMO_SIZE)
 def get_feedback(guess: str, target: str) -> str:
     if len(guess) != WORD_LENGTH or len(target) != WORD_LENGTH:
         raise ValueError("Guess and target must be of WORD_LENGTH")
@@ -64,17 +88,232 @@ def get_feedback(guess: str, target: str) -> str:
 
     return "".join(feedback)
 
-def filter_words(possible_words: List[str], guess: str, feedback: str) -> List[str]:
+def encode_feedback(feedback: str) -> int:
+    code = 0
+    for c in feedback:
+        code = code * 3 + FEEDBACK_DIGITS[c]
+    return code
+
+def decode_feedback(code: int) -> str:
+    feedback = []
+    for _ in range(WORD_LENGTH):
+        code, digit = divmod(code, 3)
+        feedback.append((GRAY, YELLOW, GREEN)[digit])
+    return "".join(reversed(feedback))
+
+def _letter_array(words: List[str]):
+    letters = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return letters.reshape(len(words), WORD_LENGTH) - ord('A')
+
+def build_feedback_matrix(guesses: List[str], targets: List[str], chunk_size: int = 128):
+    guess_letters = _letter_array(guesses)
+    target_letters = _letter_array(targets)
+    num_targets = len(targets)
+    target_range = np.arange(num_targets)
+    matrix = np.empty((len(guesses), num_targets), dtype=np.uint8)
+
+    for start in range(0, len(guesses), chunk_size):
+        chunk = guess_letters[start:start + chunk_size]
+        rows = np.arange(len(chunk))[:, None]
+        green = chunk[:, None, :] == target_letters[None, :, :]
+
+        # Letters of each target not already matched by a green, per guess row.
+        counts = np.zeros((len(chunk), num_targets, 26), dtype=np.uint8)
+        for i in range(WORD_LENGTH):
+            counts[:, target_range, target_letters[:, i]] += ~green[:, :, i]
+
+        codes = np.zeros((len(chunk), num_targets), dtype=np.uint8)
+        for i in range(WORD_LENGTH):
+            letter = chunk[:, i][:, None]
+            available = counts[rows, target_range, letter]
+            yellow = ~green[:, :, i] & (available > 0)
+            counts[rows, target_range, letter] -= yellow
+            codes *= 3
+            codes += green[:, :, i] * np.uint8(2) + yellow
+
+        matrix[start:start + len(chunk)] = codes
+
+    return matrix
+
+class FeedbackMatrix:
+    def __init__(self, words: List[str], matrix=None):
+        self.words = list(words)
+        self.index = {word: i for i, word in enumerate(self.words)}
+        if matrix is None:
+            matrix = build_feedback_matrix(self.words, self.words)
+        self.matrix = matrix
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.index
+
+    def indices(self, words: List[str]):
+        return np.fromiter((self.index[w] for w in words), dtype=np.intp, count=len(words))
+
+    def mask(self, words: List[str]):
+        mask = np.zeros(len(self.words), dtype=bool)
+        mask[self.indices(words)] = True
+        return mask
+
+    def full_mask(self):
+        return np.ones(len(self.words), dtype=bool)
+
+    def words_in(self, mask) -> List[str]:
+        return [self.words[i] for i in np.flatnonzero(mask)]
+
+    def row(self, guess: str):
+        return self.matrix[self.index[guess]]
+
+    def pattern(self, guess: str, target: str) -> int:
+        return int(self.matrix[self.index[guess], self.index[target]])
+
+def feedback_for(guess: str, target: str, feedback_matrix=None) -> str:
+    if feedback_matrix is not None and guess in feedback_matrix and target in feedback_matrix:
+        return decode_feedback(feedback_matrix.pattern(guess, target))
+    return get_feedback(guess, target)
+
+def create_feedback_matrix(words: List[str]):
+    if np is None:
+        return None
+    print(f"Building feedback matrix for {len(words)} words...")
+    start_time = time.time()
+    feedback_matrix = FeedbackMatrix(words)
+    print(f"Feedback matrix ready ({time.time() - start_time:.2f}s).")
+    return feedback_matrix
+
+def word_list_digest(words: List[str]) -> str:
+    digest = hashlib.sha256(f"{WORD_LENGTH}\n".encode("ascii"))
+    digest.update("\n".join(words).encode("ascii"))
+    return digest.hexdigest()[:16]
+
+def feedback_cache_path(filename, words: List[str]) -> str:
+    return f"{data_path(filename)}.{word_list_digest(words)}{FEEDBACK_CACHE_SUFFIX}"
+
+def _open_feedback_cache(path, num_words):
+    return np.memmap(path, dtype=np.uint8, mode='r', shape=(num_words, num_words))
+
+def load_feedback_matrix(filename, words: List[str]):
+    if np is None:
+        return None
+
+    cache_path = feedback_cache_path(filename, words)
+    num_words = len(words)
+    if os.path.exists(cache_path) and os.path.getsize(cache_path) == num_words * num_words:
+        print(f"Loaded cached feedback matrix from '{cache_path}'.")
+        return FeedbackMatrix(words, _open_feedback_cache(cache_path, num_words))
+
+    # The word list changed (or was never cached): drop sidecars for other lists.
+    for stale_path in glob.glob(f"{glob.escape(data_path(filename))}.*{FEEDBACK_CACHE_SUFFIX}"):
+        if stale_path != cache_path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
+    feedback_matrix = create_feedback_matrix(words)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        feedback_matrix.matrix.tofile(temp_path)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write feedback cache '{cache_path}': {e}")
+        return feedback_matrix
+
+    print(f"Saved feedback matrix to '{cache_path}'.")
+    return FeedbackMatrix(words, _open_feedback_cache(cache_path, num_words))
+
+# Over the feedback matrix the candidate set is a boolean mask in dictionary order. The mask is
+# the game state: each turn narrows it with one vectorized comparison, its packed bits key the
+# guess cache, and word lists are built from the survivors only.
+def filter_mask(mask, guess: str, feedback: str, feedback_matrix):
+    if guess in feedback_matrix:
+        return mask & (feedback_matrix.row(guess) == encode_feedback(feedback))
+    keep = mask.copy()
+    for i in np.flatnonzero(mask):
+        keep[i] = get_feedback(guess, feedback_matrix.words[i]) == feedback
+    return keep
+
+def mask_key(mask) -> bytes:
+    return np.packbits(mask).tobytes()
+
+def filter_words(possible_words: List[str], guess: str, feedback: str, feedback_matrix=None) -> List[str]:
+    if feedback_matrix is not None and guess in feedback_matrix:
+        mask = filter_mask(feedback_matrix.mask(possible_words), guess, feedback, feedback_matrix)
+        return feedback_matrix.words_in(mask)
+
     new_possible_words = []
     for word in possible_words:
         if get_feedback(guess, word) == feedback:
             new_possible_words.append(word)
     return new_possible_words
 
-def calculate_guess_score(guess_candidate: str, possible_words: List[str]) -> int:
+def initial_candidates(all_words: List[str], feedback_matrix=None):
+    if feedback_matrix is not None:
+        return list(feedback_matrix.words), feedback_matrix.full_mask()
+    return list(all_words), None
+
+def narrow_candidates(possible_words: List[str], possible_mask, guess: str, feedback: str, feedback_matrix=None):
+    if possible_mask is not None:
+        possible_mask = filter_mask(possible_mask, guess, feedback, feedback_matrix)
+        return feedback_matrix.words_in(possible_mask), possible_mask
+    return filter_words(possible_words, guess, feedback), None
+
+DEFAULT_OBJECTIVE = "minimax"
+ENTROPY_DECIMALS = 9
+
+def _minimax_scores(counts, num_targets):
+    return counts.max(axis=1)
+
+def _expected_scores(counts, num_targets):
+    return (counts * counts).sum(axis=1) / num_targets
+
+def _entropy_scores(counts, num_targets):
+    # Negated Shannon entropy, so that lower is better for every objective.
+    # Rounded so that ties do not depend on summation order.
+    probs = counts / num_targets
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(counts > 0, probs * np.log2(probs), 0.0)
+    return np.round(terms.sum(axis=1), ENTROPY_DECIMALS)
+
+OBJECTIVES = {
+    "minimax": _minimax_scores,
+    "expected": _expected_scores,
+    "entropy": _entropy_scores,
+}
+
+def _score_groups(group_sizes, num_targets: int, objective: str):
+    if objective == "minimax":
+        return max(group_sizes)
+    if objective == "expected":
+        return sum(size * size for size in group_sizes) / num_targets
+    if objective == "entropy":
+        return round(sum(size / num_targets * math.log2(size / num_targets) for size in group_sizes), ENTROPY_DECIMALS)
+    raise ValueError(f"Unknown objective '{objective}'")
+
+def score_guesses(feedback_matrix, target_idx, guess_idx=None, objective: str = DEFAULT_OBJECTIVE, chunk_size: int = 512):
+    score_fn = OBJECTIVES[objective]
+    if guess_idx is None:
+        guess_idx = np.arange(len(feedback_matrix.words))
+    num_targets = len(target_idx)
+    scores = np.empty(len(guess_idx), dtype=np.float64)
+
+    for start in range(0, len(guess_idx), chunk_size):
+        rows = feedback_matrix.matrix[np.ix_(guess_idx[start:start + chunk_size], target_idx)]
+        # Offset each row into its own block of pattern ids so one bincount histograms every row.
+        offsets = np.arange(len(rows))[:, None] * NUM_PATTERNS
+        counts = np.bincount((rows + offsets).ravel(), minlength=len(rows) * NUM_PATTERNS)
+        scores[start:start + len(rows)] = score_fn(counts.reshape(len(rows), NUM_PATTERNS), num_targets)
+
+    return scores
+
+def calculate_guess_score(guess_candidate: str, possible_words: List[str], feedback_matrix=None, objective: str = DEFAULT_OBJECTIVE):
     if not possible_words:
         return 0
 
+    if feedback_matrix is not None and guess_candidate in feedback_matrix:
+        patterns = feedback_matrix.row(guess_candidate)[feedback_matrix.indices(possible_words)]
+        group_sizes = np.bincount(patterns, minlength=NUM_PATTERNS)
+        return _score_groups(group_sizes[group_sizes > 0].tolist(), len(possible_words), objective)
+
     feedback_groups = collections.defaultdict(int)
     for target_word in possible_words:
         feedback = get_feedback(guess_candidate, target_word)
@@ -83,53 +322,294 @@ def calculate_guess_score(guess_candidate: str, possible_words: List[str]) -> in
     if not feedback_groups:
         return 0
 
-    max_remaining = max(feedback_groups.values())
-    return max_remaining
+    return _score_groups(feedback_groups.values(), len(possible_words), objective)
+
+def _choose_best_guess_vectorized(possible_words: List[str], candidate_guesses: List[str], feedback_matrix, objective: str,
+                                  possible_mask=None):
+    if possible_mask is None:
+        possible_mask = feedback_matrix.mask(possible_words)
+    target_idx = np.flatnonzero(possible_mask)
+    guess_idx = feedback_matrix.indices(candidate_guesses)
+    scores = score_guesses(feedback_matrix, target_idx, guess_idx, objective)
+
+    in_possible = possible_mask
+
+    # Same tie-breaking as the serial loop: first best guess that is still possible, else first best.
+    best_score = scores.min()
+    best = np.flatnonzero(scores == best_score)
+    preferred = best[in_possible[guess_idx[best]]]
+    return candidate_guesses[(preferred if len(preferred) else best)[0]], float(best_score)
+
+# Best guesses memoized by candidate set, keyed by mask_key of the candidate mask. Bounded by
+# entry count and optionally by the measured size of the keys and values it holds.
+class GuessCache:
+    def __init__(self, namespace: str, max_entries: int = 100_000, max_bytes: int = None):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = collections.OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def entry_bytes(key: bytes, entry) -> int:
+        guess, score = entry
+        return sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(guess) + sys.getsizeof(score)
+
+    def get(self, key: bytes):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: bytes, guess: str, score):
+        old = self.entries.get(key)
+        if old is not None:
+            self.bytes -= self.entry_bytes(key, old)
+        entry = self.entries[key] = (guess, score)
+        self.bytes += self.entry_bytes(key, entry)
+        self.entries.move_to_end(key)
+        while self.entries and (len(self.entries) > self.max_entries or
+                                (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            evicted_key, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.entry_bytes(evicted_key, evicted)
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def save(self, filename):
+        temp_path = f"{filename}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({
+                "namespace": self.namespace,
+                "entries": [[key.hex(), guess, score] for key, (guess, score) in self.entries.items()],
+            }, f, separators=(',', ':'))
+        os.replace(temp_path, filename)
+
+    def load(self, filename) -> bool:
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read guess cache '{filename}': {e}")
+            return False
+
+        if data.get("namespace") != self.namespace:
+            print(f"Ignoring guess cache '{filename}': built for a different word list or objective.")
+            return False
+
+        for key, guess, score in data.get("entries", []):
+            self.put(bytes.fromhex(key), guess, score)
+        return True
+
+def create_guess_cache(all_words: List[str], objective: str, filename=None, max_entries: int = 100_000,
+                       top_k: int = None, max_bytes: int = None):
+    # "mask" marks the key format, so caches keyed some other way are not loaded.
+    cache = GuessCache(f"{word_list_digest(all_words)}:{objective}:{top_k or 'all'}:mask", max_entries,
+                       max_bytes or None)
+    if filename and cache.load(filename):
+        print(f"Loaded {len(cache)} cached guesses from '{filename}'.")
+    return cache
+
+def prerank_guesses(possible_words: List[str], candidate_guesses: List[str]) -> List[int]:
+    num_possible = len(possible_words)
+    letter_counts = collections.Counter()
+    position_counts = [collections.Counter() for _ in range(WORD_LENGTH)]
+    for word in possible_words:
+        letter_counts.update(set(word))
+        for i, letter in enumerate(word):
+            position_counts[i][letter] += 1
+
+    # A letter splits the survivors best when about half of them contain it.
+    letter_value = {letter: min(count, num_possible - count) for letter, count in letter_counts.items()}
+    scores = []
+    for guess in candidate_guesses:
+        coverage = sum(letter_value.get(letter, 0) for letter in set(guess))
+        positional = sum(position_counts[i][letter] for i, letter in enumerate(guess))
+        scores.append(coverage * 2 + positional)
+    return scores
+
+def prune_candidate_guesses(possible_words: List[str], candidate_guesses: List[str], top_k: int) -> List[str]:
+    scores = prerank_guesses(possible_words, candidate_guesses)
+    keep = sorted(range(len(candidate_guesses)), key=lambda i: -scores[i])[:top_k]
+    # Keep the original order so tie-breaking matches the exhaustive search.
+    return [candidate_guesses[i] for i in sorted(keep)]
+
+def _is_better_guess(score, in_possible: bool, best_score, best_in_possible: bool) -> bool:
+    if score < best_score:
+        return True
+    return score == best_score and in_possible and not best_in_possible
+
+def _best_guess_in_shard(candidate_guesses: List[str], possible_words: List[str], objective: str):
+    possible_set = set(possible_words)
+    best = (float('inf'), False, "")
+    for guess_candidate in candidate_guesses:
+        score = calculate_guess_score(guess_candidate, possible_words, objective=objective)
+        in_possible = guess_candidate in possible_set
+        if _is_better_guess(score, in_possible, best[0], best[1]):
+            best = (score, in_possible, guess_candidate)
+    return best
+
+def _choose_best_guess_parallel(possible_words: List[str], candidate_guesses: List[str], executor, objective: str):
+    shards = [candidate_guesses[i:i + GUESS_SHARD_SIZE] for i in range(0, len(candidate_guesses), GUESS_SHARD_SIZE)]
+    futures = [executor.submit(_best_guess_in_shard, shard, possible_words, objective) for shard in shards]
+
+    # Merging in shard order with the serial rule reproduces the serial result exactly.
+    best = (float('inf'), False, "")
+    for future in futures:
+        score, in_possible, guess_candidate = future.result()
+        if _is_better_guess(score, in_possible, best[0], best[1]):
+            best = (score, in_possible, guess_candidate)
+    return best[2], best[0]
+
+def choose_best_guess(possible_words: List[str], all_words: List[str], feedback_matrix=None, objective: str = DEFAULT_OBJECTIVE, executor=None, verbose: bool = True, cache=None, top_k: int = None, possible_mask=None) -> str:
+    # The guess cache is keyed by the candidate mask, so it only applies over the feedback matrix.
+    if cache is None or possible_mask is None or len(possible_words) <= 1:
+        return choose_best_guess_with_score(possible_words, all_words, feedback_matrix, objective, executor, verbose, top_k,
+                                            possible_mask)[0]
+
+    key = mask_key(possible_mask)
+    cached = cache.get(key)
+    if cached is not None:
+        if verbose:
+            print(f"Using cached best guess for {len(possible_words)} possible targets.")
+        return cached[0]
+
+    best_guess, best_score = choose_best_guess_with_score(possible_words, all_words, feedback_matrix, objective, executor, verbose, top_k,
+                                                          possible_mask)
+    if best_score is not None:
+        cache.put(key, best_guess, best_score)
+    return best_guess
 
-def choose_best_guess(possible_words: List[str], all_words: List[str]) -> str:
+def choose_best_guess_with_score(possible_words: List[str], all_words: List[str], feedback_matrix=None, objective: str = DEFAULT_OBJECTIVE, executor=None, verbose: bool = True, top_k: int = None, possible_mask=None):
     if not possible_words:
-        return ""
+        return "", None
 
     if len(possible_words) == 1:
-        return possible_words[0]
+        return possible_words[0], None
 
     best_guess = ""
-    min_max_remaining = float('inf')
+    best_score = float('inf')
     candidate_guesses = all_words
+    if top_k is not None and len(candidate_guesses) > top_k:
+        candidate_guesses = prune_candidate_guesses(possible_words, candidate_guesses, top_k)
+    possible_set = set(possible_words)
 
-
-    print(f"Evaluating {len(candidate_guesses)} potential guesses against {len(possible_words)} possible targets...")
+    if verbose:
+        print(f"Evaluating {len(candidate_guesses)} potential guesses against {len(possible_words)} possible targets...")
     start_time = time.time()
 
-    evaluated_count = 0
-    for guess_candidate in candidate_guesses:
-        max_remaining = calculate_guess_score(guess_candidate, possible_words)
-
-        evaluated_count += 1
-        if evaluated_count % 200 == 0:
-             elapsed = time.time() - start_time
-             print(f"  ... evaluated {evaluated_count}/{len(candidate_guesses)} guesses ({elapsed:.1f}s elapsed)")
-
+    if feedback_matrix is not None and all(word in feedback_matrix for word in candidate_guesses):
+        best_guess, best_score = _choose_best_guess_vectorized(possible_words, candidate_guesses, feedback_matrix, objective,
+                                                               possible_mask)
+    elif executor is not None:
+        best_guess, best_score = _choose_best_guess_parallel(possible_words, candidate_guesses, executor, objective)
+    else:
+        evaluated_count = 0
+        for guess_candidate in candidate_guesses:
+            score = calculate_guess_score(guess_candidate, possible_words, objective=objective)
 
-        is_better = False
-        if max_remaining < min_max_remaining:
-            is_better = True
-        elif max_remaining == min_max_remaining:
-            if guess_candidate in possible_words and best_guess not in possible_words:
-                is_better = True
+            evaluated_count += 1
+            if verbose and evaluated_count % 200 == 0:
+                 elapsed = time.time() - start_time
+                 print(f"  ... evaluated {evaluated_count}/{len(candidate_guesses)} guesses ({elapsed:.1f}s elapsed)")
 
-        if is_better:
-            min_max_remaining = max_remaining
-            best_guess = guess_candidate
+            if _is_better_guess(score, guess_candidate in possible_set, best_score, best_guess in possible_set):
+                best_score = score
+                best_guess = guess_candidate
 
     end_time = time.time()
-    print(f"Evaluation complete ({end_time - start_time:.2f}s).")
+    if verbose:
+        print(f"Evaluation complete ({end_time - start_time:.2f}s).")
 
     if not best_guess:
          print("Warning: No best guess found, picking random possible word.")
-         return random.choice(possible_words)
+         return random.choice(possible_words), None
 
-    return best_guess
+    return best_guess, best_score
+
+def group_by_feedback(guess: str, possible_words: List[str], feedback_matrix=None):
+    groups = collections.defaultdict(list)
+    if feedback_matrix is not None and guess in feedback_matrix:
+        patterns = feedback_matrix.row(guess)[feedback_matrix.indices(possible_words)]
+        for word, code in zip(possible_words, patterns.tolist()):
+            groups[decode_feedback(code)].append(word)
+    else:
+        for word in possible_words:
+            groups[get_feedback(guess, word)].append(word)
+    return groups
+
+# Opening book nodes are {"g": guess, "n": {feedback: node}}; the path from the root
+# is the sequence of (guess, feedback) pairs that leads to the state.
+def build_opening_book(all_words: List[str], feedback_matrix=None, depth: int = DEFAULT_BOOK_DEPTH,
+                       objective: str = DEFAULT_OBJECTIVE, executor=None):
+    def build_node(possible_words, guess, turn):
+        node = {"g": guess}
+        if turn >= depth or len(possible_words) <= 1:
+            return node
+        branches = {}
+        for feedback, group in sorted(group_by_feedback(guess, possible_words, feedback_matrix).items()):
+            if feedback == GREEN * WORD_LENGTH:
+                continue
+            next_guess = choose_best_guess(group, all_words, feedback_matrix, objective, executor, verbose=False)
+            branches[feedback] = build_node(group, next_guess, turn + 1)
+        node["n"] = branches
+        return node
+
+    start_time = time.time()
+    tree = build_node(list(all_words), PRECOMPUTED_FIRST_GUESS, 1)
+    print(f"Built opening book to depth {depth} ({time.time() - start_time:.2f}s).")
+    return {
+        "digest": word_list_digest(all_words),
+        "depth": depth,
+        "objective": objective,
+        "tree": tree,
+    }
+
+def save_opening_book(filename, book):
+    filepath = data_path(filename)
+    temp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(book, f, separators=(',', ':'))
+    os.replace(temp_path, filepath)
+    print(f"Saved opening book to '{filepath}'.")
+
+def load_opening_book(filename, all_words: List[str], objective: str = DEFAULT_OBJECTIVE):
+    filepath = data_path(filename)
+    if not os.path.exists(filepath):
+        return None
+    try:
+        with open(filepath, 'r') as f:
+            book = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read opening book '{filepath}': {e}")
+        return None
+
+    if book.get("digest") != word_list_digest(all_words) or book.get("objective") != objective:
+        print(f"Ignoring opening book '{filepath}': built for a different word list or objective.")
+        return None
+
+    print(f"Loaded opening book from '{filepath}' (depth {book['depth']}).")
+    return book["tree"]
 
 def get_user_feedback(guess: str) -> str:
     while True:
@@ -148,10 +628,42 @@ def get_user_feedback(guess: str) -> str:
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
-def play_wordle():
+def play_wordle(workers: int = 0, objective: str = DEFAULT_OBJECTIVE, use_matrix: bool = True, cache_file=None,
+                top_k: int = None, cache_bytes: int = None):
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    try:
+        _play_game(executor, objective, use_matrix, cache_file, top_k, cache_bytes)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+def build_and_save_opening_book(depth: int = DEFAULT_BOOK_DEPTH, objective: str = DEFAULT_OBJECTIVE,
+                                workers: int = 0, use_matrix: bool = True):
     all_words = load_words(WORD_LIST_FILENAME)
-    possible_words = list(all_words)
+    feedback_matrix = load_feedback_matrix(WORD_LIST_FILENAME, all_words) if use_matrix else None
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    try:
+        book = build_opening_book(all_words, feedback_matrix, depth, objective, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    save_opening_book(OPENING_BOOK_FILENAME, book)
 
+def _play_game(executor, objective: str, use_matrix: bool, cache_file=None, top_k: int = None, cache_bytes: int = None):
+    all_words = load_words(WORD_LIST_FILENAME)
+    feedback_matrix = load_feedback_matrix(WORD_LIST_FILENAME, all_words) if use_matrix else None
+    book_node = load_opening_book(OPENING_BOOK_FILENAME, all_words, objective)
+    guess_cache = None
+    if cache_file:
+        guess_cache = create_guess_cache(all_words, objective, cache_file, top_k=top_k, max_bytes=cache_bytes)
+    try:
+        _play_turns(all_words, feedback_matrix, book_node, guess_cache, executor, objective, top_k)
+    finally:
+        if guess_cache is not None:
+            guess_cache.save(cache_file)
+
+def _play_turns(all_words, feedback_matrix, book_node, guess_cache, executor, objective: str, top_k: int = None):
+    possible_words, possible_mask = initial_candidates(all_words, feedback_matrix)
     print("\nWelcome to Wordle AI Helper!")
     print(f"Using word list: {WORD_LIST_FILENAME}")
     print(f"Goal: Guess the {WORD_LENGTH}-letter word in {MAX_GUESSES} tries.")
@@ -165,11 +677,15 @@ def play_wordle():
              print(f"  Options: {', '.join(sorted(possible_words))}")
 
 
-        if guess_num == 1 and PRECOMPUTED_FIRST_GUESS:
+        if book_node is not None:
+            guess = book_node["g"]
+            print(f"Using opening book guess: {guess}")
+        elif guess_num == 1 and PRECOMPUTED_FIRST_GUESS:
             guess = PRECOMPUTED_FIRST_GUESS
             print(f"Using precomputed first guess: {guess}")
         else:
-            guess = choose_best_guess(possible_words, all_words)
+            guess = choose_best_guess(possible_words, all_words, feedback_matrix, objective, executor,
+                                      cache=guess_cache, top_k=top_k, possible_mask=possible_mask)
 
         if not guess:
             print("Error: Could not determine a guess.")
@@ -188,7 +704,10 @@ def play_wordle():
             print(f"\nCongratulations! Solved in {guess_num} guesses.")
             break
 
-        possible_words = filter_words(possible_words, guess, feedback)
+        possible_words, possible_mask = narrow_candidates(possible_words, possible_mask, guess, feedback,
+                                                          feedback_matrix)
+        if book_node is not None:
+            book_node = book_node.get("n", {}).get(feedback)
 
         if not possible_words:
             print("\nError: No possible words match the feedback provided.")
@@ -205,4 +724,24 @@ def play_wordle():
                   print(f"  (Too many to list)")
 
 if __name__ == "__main__":
-    play_wordle()
+    parser = argparse.ArgumentParser(description="Wordle AI helper")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Worker processes for the pure-Python scorer (0 = serial)")
+    parser.add_argument("--objective", choices=sorted(OBJECTIVES), default=DEFAULT_OBJECTIVE)
+    parser.add_argument("--no-matrix", action="store_true",
+                        help="Skip the NumPy feedback matrix and use the pure-Python scorer")
+    parser.add_argument("--build-book", action="store_true",
+                        help=f"Build the opening book ({OPENING_BOOK_FILENAME}) and exit")
+    parser.add_argument("--book-depth", type=int, default=DEFAULT_BOOK_DEPTH,
+                        help="Number of turns covered by the opening book")
+    parser.add_argument("--guess-cache", metavar="PATH",
+                        help="Persist best guesses by candidate set in this file across runs")
+    parser.add_argument("--cache-bytes", type=int, default=None,
+                        help="Also bound the guess cache by the measured size of its entries")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="Only score the K most promising guesses by letter coverage")
+    args = parser.parse_args()
+    if args.build_book:
+        build_and_save_opening_book(args.book_depth, args.objective, args.workers, not args.no_matrix)
+    else:
+        play_wordle(args.workers, args.objective, not args.no_matrix, args.guess_cache, args.top_k, args.cache_bytes)
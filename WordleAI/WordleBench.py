@@ -0,0 +1,209 @@
+import argparse
+import collections
+import json
+import platform
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Wordle import (DEFAULT_OBJECTIVE, GREEN, MAX_GUESSES, OBJECTIVES, OPENING_BOOK_FILENAME,
+                    PRECOMPUTED_FIRST_GUESS, WORD_LENGTH, WORD_LIST_FILENAME, choose_best_guess,
+                    create_guess_cache, feedback_for, initial_candidates, load_feedback_matrix, load_opening_book,
+                    load_words, narrow_candidates)
+
+TARGET_CHUNK_SIZE = 64
+
+_solver_state = None
+
+def load_solver_state(objective, use_matrix, use_book, cache_entries=0, top_k=None, cache_bytes=None):
+    all_words = load_words(WORD_LIST_FILENAME)
+    feedback_matrix = load_feedback_matrix(WORD_LIST_FILENAME, all_words) if use_matrix else None
+    opening_book = load_opening_book(OPENING_BOOK_FILENAME, all_words, objective) if use_book else None
+    guess_cache = None
+    if cache_entries > 0:
+        guess_cache = create_guess_cache(all_words, objective, max_entries=cache_entries, top_k=top_k,
+                                         max_bytes=cache_bytes)
+    return all_words, feedback_matrix, opening_book, guess_cache, objective, top_k
+
+def _init_worker(objective, use_matrix, use_book, cache_entries, top_k, cache_bytes):
+    global _solver_state
+    _solver_state = load_solver_state(objective, use_matrix, use_book, cache_entries, top_k, cache_bytes)
+
+def play_target(target, all_words, feedback_matrix, opening_book, objective, guess_cache=None, top_k=None,
+                prune_stats=None):
+    possible_words, possible_mask = initial_candidates(all_words, feedback_matrix)
+    book_node = opening_book
+    # Turns that run the solver are timed apart from the free ones (opening guess, book
+    # lookups, a single candidate left), which would otherwise swamp the percentiles.
+    search_times = []
+    lookup_times = []
+
+    for guess_num in range(1, MAX_GUESSES + 1):
+        start_time = time.perf_counter()
+        searched = False
+        if book_node is not None:
+            guess = book_node["g"]
+        elif guess_num == 1 and PRECOMPUTED_FIRST_GUESS:
+            guess = PRECOMPUTED_FIRST_GUESS
+        elif len(possible_words) == 1:
+            guess = possible_words[0]
+        else:
+            guess = choose_best_guess(possible_words, all_words, feedback_matrix, objective, verbose=False,
+                                      cache=guess_cache, top_k=top_k, possible_mask=possible_mask)
+            searched = True
+        (search_times if searched else lookup_times).append(time.perf_counter() - start_time)
+
+        # Only turns where the pruned solver actually chose the guess can differ from the exhaustive one.
+        if searched and top_k is not None and prune_stats is not None:
+            exhaustive = choose_best_guess(possible_words, all_words, feedback_matrix, objective, verbose=False,
+                                           possible_mask=possible_mask)
+            prune_stats["turns"] += 1
+            prune_stats["differs"] += exhaustive != guess
+
+        feedback = feedback_for(guess, target, feedback_matrix)
+        if feedback == GREEN * WORD_LENGTH:
+            return guess_num, search_times, lookup_times
+
+        possible_words, possible_mask = narrow_candidates(possible_words, possible_mask, guess, feedback,
+                                                          feedback_matrix)
+        if book_node is not None:
+            book_node = book_node.get("n", {}).get(feedback)
+        if not possible_words:
+            break
+
+    return None, search_times, lookup_times
+
+def _play_targets(targets):
+    all_words, feedback_matrix, opening_book, guess_cache, objective, top_k = _solver_state
+    before = guess_cache.stats() if guess_cache is not None else None
+    prune_stats = collections.Counter()
+    games = [(target, *play_target(target, all_words, feedback_matrix, opening_book, objective, guess_cache,
+                                   top_k, prune_stats))
+             for target in targets]
+
+    cache_delta = {}
+    if guess_cache is not None:
+        after = guess_cache.stats()
+        cache_delta = {name: after[name] - before[name] for name in ("hits", "misses", "evictions", "bytes")}
+    return games, cache_delta, prune_stats
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+def latency_summary(sorted_times):
+    return {
+        "turns": len(sorted_times),
+        "p50": percentile(sorted_times, 50) * 1000,
+        "p95": percentile(sorted_times, 95) * 1000,
+        "p99": percentile(sorted_times, 99) * 1000,
+        "max": sorted_times[-1] * 1000 if sorted_times else 0.0,
+    }
+
+def peak_rss_kb(who):
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+    return peak // 1024 if platform.system() == "Darwin" else peak
+
+def run_benchmark(objective=DEFAULT_OBJECTIVE, use_matrix=True, use_book=True, workers=0, limit=None,
+                  cache_entries=0, top_k=None, cache_bytes=None):
+    global _solver_state
+    _solver_state = load_solver_state(objective, use_matrix, use_book, cache_entries, top_k, cache_bytes)
+    targets = _solver_state[0][:limit] if limit else _solver_state[0]
+    chunks = [targets[i:i + TARGET_CHUNK_SIZE] for i in range(0, len(targets), TARGET_CHUNK_SIZE)]
+
+    print(f"Playing {len(targets)} games ({'serial' if workers <= 0 else f'{workers} workers'})...")
+    start_time = time.perf_counter()
+    if workers > 0:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(objective, use_matrix, use_book, cache_entries, top_k,
+                                           cache_bytes)) as executor:
+            chunk_results = list(executor.map(_play_targets, chunks))
+    else:
+        chunk_results = [_play_targets(chunk) for chunk in chunks]
+    elapsed = time.perf_counter() - start_time
+
+    results = [game for games, _, _ in chunk_results for game in games]
+    cache_stats = collections.Counter()
+    prune_stats = collections.Counter()
+    for _, cache_delta, chunk_prune_stats in chunk_results:
+        cache_stats.update(cache_delta)
+        prune_stats.update(chunk_prune_stats)
+
+    distribution = {str(n): 0 for n in range(1, MAX_GUESSES + 1)}
+    failures = []
+    guess_counts = []
+    search_times = []
+    lookup_times = []
+    for target, guesses, game_search_times, game_lookup_times in results:
+        search_times.extend(game_search_times)
+        lookup_times.extend(game_lookup_times)
+        if guesses is None:
+            failures.append(target)
+        else:
+            distribution[str(guesses)] += 1
+            guess_counts.append(guesses)
+    search_times.sort()
+    lookup_times.sort()
+
+    return {
+        "word_list": WORD_LIST_FILENAME,
+        "objective": objective,
+        "feedback_matrix": use_matrix and _solver_state[1] is not None,
+        "opening_book": use_book and _solver_state[2] is not None,
+        "workers": workers,
+        "games": len(results),
+        "guess_distribution": distribution,
+        "failures": len(failures),
+        "failed_targets": sorted(failures),
+        "mean_guesses": sum(guess_counts) / len(guess_counts) if guess_counts else None,
+        "turn_latency_ms": latency_summary(search_times),
+        "lookup_turn_latency_ms": latency_summary(lookup_times),
+        "elapsed_s": elapsed,
+        "peak_rss_kb": peak_rss_kb(resource.RUSAGE_SELF),
+        "peak_rss_children_kb": peak_rss_kb(resource.RUSAGE_CHILDREN),
+        "guess_cache": dict(cache_stats) if cache_entries > 0 else None,
+        "pruning": {
+            "top_k": top_k,
+            "turns": prune_stats["turns"],
+            "differs_from_exhaustive": prune_stats["differs"],
+            "differ_rate": prune_stats["differs"] / prune_stats["turns"] if prune_stats["turns"] else 0.0,
+        } if top_k is not None else None,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play every word in the word list and report solver statistics")
+    parser.add_argument("--objective", choices=sorted(OBJECTIVES), default=DEFAULT_OBJECTIVE)
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes playing games (0 = serial)")
+    parser.add_argument("--limit", type=int, default=None, help="Only play the first N targets")
+    parser.add_argument("--no-matrix", action="store_true", help="Use the pure-Python scorer")
+    parser.add_argument("--no-book", action="store_true", help="Ignore the opening book")
+    parser.add_argument("--cache-entries", type=int, default=0,
+                        help="Memoize best guesses by candidate set across games (0 disables)")
+    parser.add_argument("--cache-bytes", type=int, default=None,
+                        help="Also bound the guess cache by the measured size of its entries")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="Prune to the K most promising guesses and report how often that changes the choice")
+    parser.add_argument("--output", default="wordle_bench.json", help="Path of the JSON report")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.objective, not args.no_matrix, not args.no_book, args.workers, args.limit,
+                           args.cache_entries, args.top_k, args.cache_bytes)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Games: {report['games']}  Failures: {report['failures']}  Mean guesses: {report['mean_guesses']}")
+    print(f"Distribution: {report['guess_distribution']}")
+    latency = report['turn_latency_ms']
+    print(f"Solver turn latency ms ({latency['turns']} turns): p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  "
+          f"p99 {latency['p99']:.2f}")
+    latency = report['lookup_turn_latency_ms']
+    print(f"Opening/book/single-word turns: {latency['turns']} (p99 {latency['p99']:.3f} ms)")
+    print(f"Peak RSS: {report['peak_rss_kb']} KB (children {report['peak_rss_children_kb']} KB)")
+    if report['guess_cache'] is not None:
+        print(f"Guess cache: {report['guess_cache']}")
+    if report['pruning'] is not None:
+        print(f"Pruning: {report['pruning']}")
+    print(f"Wrote report to '{args.output}'.")
@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from WordleBench import percentile
+from Wordle import WORD_LIST_FILENAME, get_feedback, load_words
+from WordleServer import DEFAULT_HOST, DEFAULT_PORT
+
+async def request(reader, writer, payload):
+    writer.write(json.dumps(payload).encode() + b"\n")
+    await writer.drain()
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Server closed the connection")
+    return json.loads(line)
+
+async def play_session(host, port, target, stats):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        start_time = time.perf_counter()
+        response = await request(reader, writer, {"op": "new"})
+        stats["latencies"].append(time.perf_counter() - start_time)
+        session_id = response["session"]
+
+        while "guess" in response:
+            feedback = get_feedback(response["guess"], target)
+            start_time = time.perf_counter()
+            response = await request(reader, writer, {"op": "feedback", "session": session_id, "feedback": feedback})
+            stats["latencies"].append(time.perf_counter() - start_time)
+
+        if response.get("solved"):
+            stats["solved"] += 1
+        else:
+            stats["failed"] += 1
+    except (ConnectionError, OSError, KeyError, ValueError):
+        stats["errors"] += 1
+    finally:
+        writer.close()
+
+async def run_load(host, port, sessions, concurrency, seed):
+    targets = load_words(WORD_LIST_FILENAME)
+    rng = random.Random(seed)
+    stats = {"solved": 0, "failed": 0, "errors": 0, "latencies": []}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited_session(target):
+        async with semaphore:
+            await play_session(host, port, target, stats)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(limited_session(rng.choice(targets)) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start_time
+
+    latencies = sorted(stats["latencies"])
+    return {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "solved": stats["solved"],
+        "failed": stats["failed"],
+        "errors": stats["errors"],
+        "requests": len(latencies),
+        "elapsed_s": elapsed,
+        "sessions_per_s": sessions / elapsed,
+        "requests_per_s": len(latencies) / elapsed,
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1000,
+            "p95": percentile(latencies, 95) * 1000,
+            "p99": percentile(latencies, 99) * 1000,
+        },
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate many concurrent sessions against WordleServer.py")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--sessions", type=int, default=2000, help="Total sessions to play")
+    parser.add_argument("--concurrency", type=int, default=500, help="Sessions in flight at once")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load(args.host, args.port, args.sessions, args.concurrency, args.seed))
+    print(json.dumps(report, indent=2))
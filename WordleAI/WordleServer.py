@@ -0,0 +1,216 @@
+import argparse
+import asyncio
+import json
+import signal
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from Wordle import (DEFAULT_OBJECTIVE, FEEDBACK_DIGITS, GREEN, MAX_GUESSES, OBJECTIVES, OPENING_BOOK_FILENAME,
+                    PRECOMPUTED_FIRST_GUESS, WORD_LENGTH, WORD_LIST_FILENAME, choose_best_guess_with_score,
+                    create_guess_cache, initial_candidates, load_feedback_matrix, load_opening_book, load_words,
+                    mask_key, narrow_candidates)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SESSION_TTL = 600
+SWEEP_INTERVAL = 60
+
+# Immutable solver state shared by every session (and loaded once per worker process).
+_word_index = None
+
+def load_word_index(objective=DEFAULT_OBJECTIVE, use_matrix=True, use_book=True):
+    all_words = load_words(WORD_LIST_FILENAME)
+    feedback_matrix = load_feedback_matrix(WORD_LIST_FILENAME, all_words) if use_matrix else None
+    opening_book = load_opening_book(OPENING_BOOK_FILENAME, all_words, objective) if use_book else None
+    return all_words, feedback_matrix, opening_book
+
+def _init_worker(objective, use_matrix):
+    global _word_index
+    _word_index = load_word_index(objective, use_matrix, use_book=False)
+
+def _suggest_guess(possible_words, possible_mask, objective, top_k=None):
+    all_words, feedback_matrix, _ = _word_index
+    return choose_best_guess_with_score(possible_words, all_words, feedback_matrix, objective, verbose=False,
+                                        top_k=top_k, possible_mask=possible_mask)
+
+class GameSession:
+    def __init__(self, all_words, feedback_matrix, opening_book):
+        self.possible_words, self.possible_mask = initial_candidates(all_words, feedback_matrix)
+        self.book_node = opening_book
+        self.guess_num = 0
+        self.guess = None
+        self.last_seen = time.monotonic()
+
+class WordleServer:
+    def __init__(self, executor, objective=DEFAULT_OBJECTIVE, guess_cache=None, top_k=None):
+        self.executor = executor
+        self.objective = objective
+        self.top_k = top_k
+        self.guess_cache = guess_cache
+        self.sessions = {}
+        self.requests_served = 0
+
+    async def next_guess(self, session_id, session):
+        session.guess_num += 1
+        if session.book_node is not None:
+            guess = session.book_node["g"]
+        elif session.guess_num == 1 and PRECOMPUTED_FIRST_GUESS:
+            guess = PRECOMPUTED_FIRST_GUESS
+        elif len(session.possible_words) == 1:
+            guess = session.possible_words[0]
+        else:
+            guess = await self.suggest_guess(session.possible_words, session.possible_mask)
+        session.guess = guess
+        return {"session": session_id, "guess": guess, "turn": session.guess_num,
+                "remaining": len(session.possible_words)}
+
+    async def suggest_guess(self, possible_words, possible_mask):
+        key = None
+        if self.guess_cache is not None and possible_mask is not None:
+            key = mask_key(possible_mask)
+            cached = self.guess_cache.get(key)
+            if cached is not None:
+                return cached[0]
+
+        loop = asyncio.get_running_loop()
+        guess, score = await loop.run_in_executor(self.executor, _suggest_guess, possible_words, possible_mask,
+                                                 self.objective, self.top_k)
+        if key is not None and score is not None:
+            self.guess_cache.put(key, guess, score)
+        return guess
+
+    async def handle_request(self, request):
+        op = request.get("op")
+        all_words, feedback_matrix, opening_book = _word_index
+
+        if op == "new":
+            session_id = uuid.uuid4().hex
+            session = GameSession(all_words, feedback_matrix, opening_book)
+            self.sessions[session_id] = session
+            return await self.next_guess(session_id, session)
+
+        if op == "stats":
+            stats = {"sessions": len(self.sessions), "requests": self.requests_served}
+            if self.guess_cache is not None:
+                stats["guess_cache"] = self.guess_cache.stats()
+            return stats
+
+        session_id = request.get("session")
+        session = self.sessions.get(session_id)
+        if session is None:
+            return {"error": f"Unknown session '{session_id}'"}
+        session.last_seen = time.monotonic()
+
+        if op == "end":
+            del self.sessions[session_id]
+            return {"session": session_id, "ended": True}
+
+        if op != "feedback":
+            return {"error": f"Unknown op '{op}'"}
+
+        feedback = str(request.get("feedback", "")).upper()
+        if len(feedback) != WORD_LENGTH or not all(c in FEEDBACK_DIGITS for c in feedback):
+            return {"error": f"Feedback must be {WORD_LENGTH} characters of G, Y or X"}
+
+        if feedback == GREEN * WORD_LENGTH:
+            del self.sessions[session_id]
+            return {"session": session_id, "solved": True, "turn": session.guess_num}
+
+        session.possible_words, session.possible_mask = narrow_candidates(
+            session.possible_words, session.possible_mask, session.guess, feedback, feedback_matrix)
+        if session.book_node is not None:
+            session.book_node = session.book_node.get("n", {}).get(feedback)
+
+        if not session.possible_words or session.guess_num >= MAX_GUESSES:
+            del self.sessions[session_id]
+            reason = "no words match the feedback" if not session.possible_words else "out of guesses"
+            return {"session": session_id, "failed": True, "reason": reason,
+                    "remaining": len(session.possible_words)}
+
+        return await self.next_guess(session_id, session)
+
+    async def handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    response = {"error": f"Invalid request: {e}"}
+                else:
+                    if isinstance(request, dict):
+                        response = await self.handle_request(request)
+                    else:
+                        response = {"error": "Request must be a JSON object"}
+                self.requests_served += 1
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def sweep_sessions(self):
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            cutoff = time.monotonic() - SESSION_TTL
+            for session_id in [sid for sid, s in self.sessions.items() if s.last_seen < cutoff]:
+                del self.sessions[session_id]
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=0, objective=DEFAULT_OBJECTIVE, use_matrix=True,
+                use_threads=False, cache_entries=0, cache_file=None, top_k=None, cache_bytes=None):
+    global _word_index
+    _word_index = load_word_index(objective, use_matrix)
+    guess_cache = None
+    if cache_entries > 0:
+        guess_cache = create_guess_cache(_word_index[0], objective, cache_file, cache_entries, top_k, cache_bytes)
+
+    if use_threads:
+        executor = ThreadPoolExecutor(max_workers=workers or None)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers or None, initializer=_init_worker,
+                                       initargs=(objective, use_matrix))
+    server = WordleServer(executor, objective, guess_cache, top_k)
+    sweeper = asyncio.create_task(server.sweep_sessions())
+    tcp_server = await asyncio.start_server(server.handle_client, host, port)
+    print(f"Wordle server listening on {host}:{port}")
+    stop = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            asyncio.get_running_loop().add_signal_handler(signum, stop.set)
+        except NotImplementedError:
+            pass
+    try:
+        async with tcp_server:
+            await stop.wait()
+    finally:
+        sweeper.cancel()
+        executor.shutdown()
+        if guess_cache is not None and cache_file:
+            guess_cache.save(cache_file)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Wordle AI sessions over line-delimited JSON on TCP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=0, help="Scoring workers (0 = one per CPU)")
+    parser.add_argument("--threads", action="store_true", help="Score in a thread pool instead of processes")
+    parser.add_argument("--objective", choices=sorted(OBJECTIVES), default=DEFAULT_OBJECTIVE)
+    parser.add_argument("--no-matrix", action="store_true", help="Use the pure-Python scorer")
+    parser.add_argument("--cache-entries", type=int, default=100_000,
+                        help="Best guesses memoized by candidate set across sessions (0 disables)")
+    parser.add_argument("--cache-bytes", type=int, default=None,
+                        help="Also bound the guess cache by the measured size of its entries")
+    parser.add_argument("--guess-cache", metavar="PATH", help="Load and save the guess cache in this file")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="Only score the K most promising guesses by letter coverage")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.objective, not args.no_matrix, args.threads,
+                          args.cache_entries, args.guess_cache, args.top_k, args.cache_bytes))
+    except KeyboardInterrupt:
+        pass
+    print("\nShutting down.")